@@ -2,41 +2,145 @@
 Flask API 라우트 정의
 """
 import logging
+import time
 from datetime import datetime
-from flask import Blueprint, request, jsonify
+import orjson
+from flask import Blueprint, Response, current_app, request, jsonify, stream_with_context
 from typing import Dict, Any
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from pydantic import ValidationError
+from config.settings import settings
+from api.schemas import (
+    CreateCompanyBody,
+    CreateReviewBody,
+    BulkCreateReviewsBody,
+    CreateDepartmentBody,
+    AnalyzeReviewsBody,
+)
 from services.review_service import review_service
-from models.database import FinancialCompany
+from models.database import FinancialCompany, Department
 from database.connection import db_manager
-from services.autogen_service import autogen_service
-from services.monitoring_service import monitoring_service
+from database.redis_client import redis_manager
+from database.opensearch_client import opensearch_manager
+from services.autogen_service import get_autogen_service
+from services.monitoring_service import get_monitoring_service
 
 logger = logging.getLogger(__name__)
 
 # Blueprint 생성
 api_bp = Blueprint('api', __name__, url_prefix='/api')
 
+# 정적 목록 캐시 키
+COMPANIES_CACHE_KEY = "companies:all"
+DEPARTMENTS_CACHE_KEY = "departments:all"
+
+# 한 번에 분석 요청 가능한 리뷰 ID 수 상한
+MAX_ANALYZE_REVIEW_IDS = 5000
+
+
+# 초 단위로 캐시된 UTC ISO 타임스탬프 [문자열, 갱신 시각]
+_ts_cache = ['', 0.0]
+
+
+def _now_iso() -> str:
+    """UTC ISO 타임스탬프 반환 (최대 1초에 1회만 재계산)"""
+    now = time.time()
+    if now - _ts_cache[1] >= 1.0:
+        _ts_cache[0] = datetime.utcfromtimestamp(now).isoformat()
+        _ts_cache[1] = now
+    return _ts_cache[0]
+
+
+def _orjson_response(payload: Any, status: int = 200):
+    """orjson으로 직렬화한 JSON 응답 생성 (datetime은 ISO 8601로 변환)"""
+    return current_app.response_class(
+        orjson.dumps(payload),
+        status=status,
+        mimetype='application/json'
+    )
+
+
+def _build_companies_payload() -> list:
+    """금융사 목록 페이로드 생성 (Core SELECT, 캐시 호환 형태)"""
+    with db_manager.get_session() as session:
+        rows = session.execute(
+            select(
+                FinancialCompany.id,
+                FinancialCompany.name,
+                FinancialCompany.app_id,
+                FinancialCompany.category,
+                FinancialCompany.created_at
+            )
+        ).mappings().all()
+        # orjson 왕복으로 datetime을 ISO 문자열로 정규화 (캐시 호환)
+        return orjson.loads(orjson.dumps([dict(row) for row in rows]))
+
+
+def _build_departments_payload() -> list:
+    """부서 목록 페이로드 생성 (Core SELECT, 캐시 호환 형태)"""
+    with db_manager.get_session() as session:
+        rows = session.execute(
+            select(
+                Department.id,
+                Department.name,
+                Department.description,
+                Department.keywords,
+                Department.created_at
+            )
+        ).mappings().all()
+        return orjson.loads(orjson.dumps([dict(row) for row in rows]))
+
+
+def preload_caches():
+    """정적 목록 캐시 예열 (부팅 시 호출, 첫 요청의 DB 왕복 제거)"""
+    try:
+        # 두 키를 파이프라인 1회 왕복으로 저장
+        redis_manager.mset({
+            COMPANIES_CACHE_KEY: _build_companies_payload(),
+            DEPARTMENTS_CACHE_KEY: _build_departments_payload()
+        }, settings.CACHE_TTL_SECONDS)
+        logger.info("정적 목록 캐시 예열 완료")
+    except Exception as e:
+        logger.warning(f"캐시 예열 실패: {e}")
+
+
+# 헬스 체크 응답 캐시 (초 단위로만 재직렬화)
+_health_body_cache = (0, b'')
+
 
 @api_bp.route('/health', methods=['GET'])
 def health_check():
     """헬스 체크"""
-    return jsonify({
-        'status': 'healthy',
-        'timestamp': datetime.utcnow().isoformat(),
-        'version': '1.0.0'
-    })
+    global _health_body_cache
+
+    now = int(time.time())
+    cached_second, body = _health_body_cache
+
+    if cached_second != now:
+        body = orjson.dumps({
+            'status': 'healthy',
+            'timestamp': _now_iso(),
+            'version': '1.0.0'
+        })
+        _health_body_cache = (now, body)
+
+    return current_app.response_class(body, mimetype='application/json')
 
 
 @api_bp.route('/companies', methods=['GET'])
 def get_companies():
     """금융사 목록 조회"""
     try:
-        with db_manager.get_session() as session:
-            companies = session.query(FinancialCompany).all()
-            return jsonify({
-                'success': True,
-                'data': [company.to_dict() for company in companies]
-            })
+        # 금융사 목록은 변경이 드물어 Redis 캐시로 DB 조회를 생략
+        payload = redis_manager.get_or_build(
+            COMPANIES_CACHE_KEY, _build_companies_payload, settings.CACHE_TTL_SECONDS
+        )
+
+        return _orjson_response({
+            'success': True,
+            'data': payload
+        })
     except Exception as e:
         logger.error(f"금융사 목록 조회 오류: {e}")
         return jsonify({
@@ -49,35 +153,36 @@ def get_companies():
 def create_company():
     """금융사 생성"""
     try:
-        data = request.get_json()
-        
-        if not data or not data.get('name') or not data.get('app_id'):
+        try:
+            body = CreateCompanyBody.model_validate(request.get_json(silent=True))
+        except ValidationError:
             return jsonify({
                 'success': False,
                 'error': 'name과 app_id는 필수입니다'
             }), 400
-        
+
         with db_manager.get_session() as session:
-            # 중복 확인
-            existing = session.query(FinancialCompany).filter_by(
-                app_id=data['app_id']
-            ).first()
-            
-            if existing:
+            company = FinancialCompany(
+                name=body.name,
+                app_id=body.app_id,
+                category=body.category
+            )
+
+            session.add(company)
+
+            # 중복 확인은 사전 SELECT 대신 app_id UNIQUE 제약에 위임
+            try:
+                session.commit()
+            except IntegrityError:
+                session.rollback()
                 return jsonify({
                     'success': False,
                     'error': '이미 존재하는 app_id입니다'
                 }), 400
-            
-            company = FinancialCompany(
-                name=data['name'],
-                app_id=data['app_id'],
-                category=data.get('category')
-            )
-            
-            session.add(company)
-            session.commit()
-            
+
+            # 캐시 무효화
+            redis_manager.delete(COMPANIES_CACHE_KEY)
+
             return jsonify({
                 'success': True,
                 'data': company.to_dict()
@@ -125,25 +230,16 @@ def get_reviews():
 def create_review():
     """리뷰 생성"""
     try:
-        data = request.get_json()
-        
-        if not data or not data.get('company_id') or not data.get('content') or not data.get('platform'):
+        try:
+            # pydantic이 필수 필드 확인과 ISO 8601 날짜 파싱을 한 번에 수행
+            body = CreateReviewBody.model_validate(request.get_json(silent=True))
+        except ValidationError:
             return jsonify({
                 'success': False,
                 'error': 'company_id, content, platform은 필수입니다'
             }), 400
-        
-        # 날짜 파싱
-        if data.get('review_date'):
-            try:
-                data['review_date'] = datetime.fromisoformat(data['review_date'].replace('Z', '+00:00'))
-            except ValueError:
-                return jsonify({
-                    'success': False,
-                    'error': '잘못된 날짜 형식입니다'
-                }), 400
-        
-        review = review_service.create_review(data)
+
+        review = review_service.create_review(body.model_dump())
         
         if not review:
             return jsonify({
@@ -164,25 +260,108 @@ def create_review():
         }), 500
 
 
+@api_bp.route('/reviews/bulk', methods=['POST'])
+def bulk_create_reviews():
+    """리뷰 일괄 생성 (단일 트랜잭션 + 일괄 LLM 분석 + 배치 인덱싱)"""
+    try:
+        try:
+            body = BulkCreateReviewsBody.model_validate(request.get_json(silent=True))
+        except ValidationError:
+            return jsonify({
+                'success': False,
+                'error': 'reviews 배열(각 항목: company_id, content, platform)은 필수입니다'
+            }), 400
+
+        result = review_service.bulk_create_reviews(
+            [item.model_dump() for item in body.reviews]
+        )
+
+        if not result['created']:
+            return jsonify({
+                'success': False,
+                'error': '리뷰 일괄 생성에 실패했습니다',
+                'data': result
+            }), 500
+
+        return jsonify({
+            'success': True,
+            'data': result
+        }), 201
+
+    except Exception as e:
+        logger.error(f"리뷰 일괄 생성 오류: {e}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+@api_bp.route('/reviews/export', methods=['GET'])
+def export_reviews():
+    """리뷰 목록 NDJSON 스트리밍 (대량 조회용, 전체 목록을 메모리에 올리지 않음)"""
+    try:
+        company_id = request.args.get('company_id', type=int)
+        sentiment = request.args.get('sentiment')
+        department = request.args.get('department')
+
+        def generate():
+            for row in review_service.stream_reviews(
+                company_id=company_id,
+                sentiment=sentiment,
+                department=department
+            ):
+                yield orjson.dumps(row) + b'\n'
+
+        return Response(
+            stream_with_context(generate()),
+            mimetype='application/x-ndjson'
+        )
+
+    except Exception as e:
+        logger.error(f"리뷰 스트리밍 오류: {e}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
 @api_bp.route('/reviews/search', methods=['GET'])
 def search_reviews():
-    """리뷰 검색"""
+    """리뷰 검색 (q를 여러 번 지정하면 msearch 1회 왕복으로 일괄 검색)"""
     try:
-        query = request.args.get('q')
+        queries = request.args.getlist('q')
         size = request.args.get('size', default=10, type=int)
-        
-        if not query:
+
+        if not queries:
             return jsonify({
                 'success': False,
                 'error': '검색어(q)는 필수입니다'
             }), 400
-        
-        results = review_service.search_reviews(query, size)
-        
+
+        if len(queries) == 1 and request.args.get('raw') == '1':
+            # OpenSearch 원본 JSON을 역직렬화 없이 그대로 전달하는 고속 경로
+            raw_body = opensearch_manager.search_raw(
+                {"query": {"match": {"content": queries[0]}}}, size
+            )
+            if raw_body is not None:
+                return Response(raw_body, mimetype='application/json')
+
+        if len(queries) == 1:
+            results = review_service.search_reviews(queries[0], size)
+
+            return jsonify({
+                'success': True,
+                'data': results,
+                'count': len(results)
+            })
+
+        # 여러 검색어는 한 번의 OpenSearch 왕복으로 처리
+        batch_results = review_service.search_reviews_multi(queries, size)
+
         return jsonify({
             'success': True,
-            'data': results,
-            'count': len(results)
+            'data': batch_results,
+            'count': sum(len(hits) for hits in batch_results.values())
         })
         
     except Exception as e:
@@ -195,12 +374,21 @@ def search_reviews():
 
 @api_bp.route('/reviews/sentiment-stats', methods=['GET'])
 def get_sentiment_statistics():
-    """감정 통계 조회"""
+    """감정 통계 조회 (company_id를 여러 번 지정하면 MGET 1회로 일괄 조회)"""
     try:
-        company_id = request.args.get('company_id', type=int)
-        
-        stats = review_service.get_sentiment_statistics(company_id)
-        
+        company_ids = request.args.getlist('company_id', type=int)
+
+        if len(company_ids) > 1:
+            stats_by_company = review_service.get_sentiment_statistics_multi(company_ids)
+            return jsonify({
+                'success': True,
+                'data': {str(cid): stats for cid, stats in stats_by_company.items()}
+            })
+
+        stats = review_service.get_sentiment_statistics(
+            company_ids[0] if company_ids else None
+        )
+
         return jsonify({
             'success': True,
             'data': stats
@@ -218,22 +406,33 @@ def get_sentiment_statistics():
 def analyze_reviews_with_autogen():
     """AutoGen을 사용한 리뷰 분석"""
     try:
-        data = request.get_json()
-        
-        if not data or not data.get('review_ids'):
+        try:
+            body = AnalyzeReviewsBody.model_validate(request.get_json(silent=True))
+        except ValidationError:
             return jsonify({
                 'success': False,
                 'error': 'review_ids는 필수입니다'
             }), 400
-        
-        review_ids = data['review_ids']
-        analysis_type = data.get('analysis_type', 'comprehensive')
-        
-        # 리뷰 데이터 조회
+
+        review_ids = body.review_ids
+        analysis_type = body.analysis_type
+
+        # 요청 크기 제한 (지연 시간 및 메모리 사용량 상한)
+        if len(review_ids) > MAX_ANALYZE_REVIEW_IDS:
+            return jsonify({
+                'success': False,
+                'error': f'review_ids는 최대 {MAX_ANALYZE_REVIEW_IDS}개까지 허용됩니다'
+            }), 400
+
+        # 리뷰 데이터 조회 (단일 IN 쿼리 + 스트리밍으로 메모리 사용량 제한)
         with db_manager.get_session() as session:
             from models.database import Review
-            reviews = session.query(Review).filter(Review.id.in_(review_ids)).all()
-            review_data = [review.to_dict() for review in reviews]
+            stmt = (
+                select(Review)
+                .where(Review.id.in_(review_ids))
+                .execution_options(yield_per=500)
+            )
+            review_data = [review.to_dict() for review in session.execute(stmt).scalars()]
         
         if not review_data:
             return jsonify({
@@ -241,14 +440,17 @@ def analyze_reviews_with_autogen():
                 'error': '분석할 리뷰를 찾을 수 없습니다'
             }), 404
         
-        # AutoGen 분석 수행
-        analysis_result = autogen_service.analyze_reviews(review_data, analysis_type)
-        
+        # AutoGen 분석을 백그라운드 작업으로 제출 (요청 스레드를 점유하지 않음)
+        job_id = get_autogen_service().submit_analysis(review_data, analysis_type)
+
         return jsonify({
             'success': True,
-            'data': analysis_result
-        })
-        
+            'data': {
+                'job_id': job_id,
+                'status': 'pending'
+            }
+        }), 202
+
     except Exception as e:
         logger.error(f"AutoGen 리뷰 분석 오류: {e}")
         return jsonify({
@@ -257,23 +459,54 @@ def analyze_reviews_with_autogen():
         }), 500
 
 
+@api_bp.route('/reviews/analyze/<job_id>', methods=['GET'])
+def get_analysis_job(job_id):
+    """AutoGen 리뷰 분석 작업 상태/결과 조회"""
+    try:
+        job = get_autogen_service().get_job(job_id)
+
+        if job is None:
+            return jsonify({
+                'success': False,
+                'error': '작업을 찾을 수 없습니다'
+            }), 404
+
+        return jsonify({
+            'success': True,
+            'data': job
+        })
+
+    except Exception as e:
+        logger.error(f"분석 작업 조회 오류: {e}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
 @api_bp.route('/system/status', methods=['GET'])
 def get_system_status():
     """시스템 상태 조회"""
     try:
-        from database.redis_client import redis_manager
-        from database.opensearch_client import opensearch_manager
-        from services.llm_service import llm_service
-        
-        status = {
-            'database': db_manager.test_connection(),
-            'redis': redis_manager.test_connection(),
-            'opensearch': opensearch_manager.test_connection(),
-            'llm': llm_service.is_available(),
-            'autogen': autogen_service.get_agent_status(),
-            'monitoring': monitoring_service.get_monitoring_status(),
-            'timestamp': datetime.utcnow().isoformat()
-        }
+        from concurrent.futures import ThreadPoolExecutor
+        from services.llm_service import get_llm_service
+
+        # 독립적인 헬스 체크를 병렬 수행 (4회 왕복 → 가장 느린 1회 수준)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            db_future = executor.submit(db_manager.test_connection)
+            redis_future = executor.submit(redis_manager.test_connection)
+            opensearch_future = executor.submit(opensearch_manager.test_connection)
+            llm_future = executor.submit(lambda: get_llm_service().is_available())
+
+            status = {
+                'database': db_future.result(),
+                'redis': redis_future.result(),
+                'opensearch': opensearch_future.result(),
+                'llm': llm_future.result(),
+                'autogen': get_autogen_service().get_agent_status(),
+                'monitoring': get_monitoring_service().get_monitoring_status(),
+                'timestamp': _now_iso()
+            }
         
         return jsonify({
             'success': True,
@@ -292,12 +525,14 @@ def get_system_status():
 def get_departments():
     """부서 목록 조회"""
     try:
-        with db_manager.get_session() as session:
-            departments = review_service.get_departments(session)
-            return jsonify({
-                'success': True,
-                'data': [dept.to_dict() for dept in departments]
-            })
+        # 부서 목록도 변경이 드물어 Redis 캐시로 DB 조회를 생략
+        payload = redis_manager.get_or_build(
+            DEPARTMENTS_CACHE_KEY, _build_departments_payload, settings.CACHE_TTL_SECONDS
+        )
+        return _orjson_response({
+            'success': True,
+            'data': payload
+        })
     except Exception as e:
         logger.error(f"부서 목록 조회 오류: {e}")
         return jsonify({
@@ -310,22 +545,25 @@ def get_departments():
 def create_department():
     """부서 생성"""
     try:
-        data = request.get_json()
-        
-        if not data or not data.get('name'):
+        try:
+            body = CreateDepartmentBody.model_validate(request.get_json(silent=True))
+        except ValidationError:
             return jsonify({
                 'success': False,
                 'error': 'name은 필수입니다'
             }), 400
-        
-        department = review_service.create_department(data)
-        
+
+        department = review_service.create_department(body.model_dump())
+
         if not department:
             return jsonify({
                 'success': False,
                 'error': '부서 생성에 실패했습니다'
             }), 500
-        
+
+        # 캐시 무효화
+        redis_manager.delete(DEPARTMENTS_CACHE_KEY)
+
         return jsonify({
             'success': True,
             'data': department.to_dict()
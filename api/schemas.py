@@ -0,0 +1,40 @@
+"""
+API 요청 본문 검증 모델
+"""
+from datetime import datetime
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+
+class CreateCompanyBody(BaseModel):
+    """금융사 생성 요청 본문"""
+    name: str = Field(min_length=1)
+    app_id: str = Field(min_length=1)
+    category: Optional[str] = None
+
+
+class CreateReviewBody(BaseModel):
+    """리뷰 생성 요청 본문 (review_date는 ISO 8601, 'Z' 접미사 허용)"""
+    company_id: int
+    content: str = Field(min_length=1)
+    platform: str
+    rating: Optional[int] = None
+    review_date: Optional[datetime] = None
+
+
+class BulkCreateReviewsBody(BaseModel):
+    """리뷰 일괄 생성 요청 본문"""
+    reviews: List[CreateReviewBody] = Field(min_length=1, max_length=5000)
+
+
+class CreateDepartmentBody(BaseModel):
+    """부서 생성 요청 본문"""
+    name: str = Field(min_length=1)
+    description: Optional[str] = None
+    keywords: List[str] = Field(default_factory=list)
+
+
+class AnalyzeReviewsBody(BaseModel):
+    """리뷰 분석 요청 본문"""
+    review_ids: List[int] = Field(min_length=1)
+    analysis_type: str = 'comprehensive'
@@ -3,7 +3,9 @@ Flask 애플리케이션 메인 파일
 """
 import logging
 import sys
+import orjson
 from flask import Flask
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from config.settings import settings
 from database.connection import db_manager
@@ -17,10 +19,30 @@ setup_logging()
 logger = logging.getLogger(__name__)
 
 
+class OrjsonProvider(DefaultJSONProvider):
+    """orjson 기반 Flask JSON 프로바이더 (C 인코더, datetime은 ISO 8601 처리)"""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+        ).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 def create_app() -> Flask:
     """Flask 애플리케이션 팩토리"""
     app = Flask(__name__)
-    
+
+    # jsonify / request.get_json이 orjson을 사용하도록 교체
+    app.json = OrjsonProvider(app)
+
+    # 후행 슬래시 불일치로 인한 301 리다이렉트(추가 왕복) 제거
+    app.url_map.strict_slashes = False
+    app.url_map.merge_slashes = True
+
     # CORS 설정
     CORS(app, resources={
         r"/api/*": {
@@ -57,7 +79,12 @@ def initialize_services():
         opensearch_manager.create_index()
     else:
         logger.warning("OpenSearch 연결 실패 - 검색 기능이 비활성화됩니다")
-    
+
+    # 정적 목록 캐시 예열
+    if settings.PRELOAD_CACHE_ENABLED:
+        from api.routes import preload_caches
+        preload_caches()
+
     logger.info("서비스 초기화 완료")
 
 
@@ -2,6 +2,7 @@
 애플리케이션 설정 관리
 """
 import os
+from functools import cached_property
 from typing import List, Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field
@@ -34,6 +35,9 @@ class Settings(BaseSettings):
     LLM_MAX_TOKENS: int = Field(default=4096, env="LLM_MAX_TOKENS")
     LLM_TIMEOUT: int = Field(default=60, env="LLM_TIMEOUT")
     LLM_MAX_RETRIES: int = Field(default=3, env="LLM_MAX_RETRIES")
+    LLM_MAX_CONCURRENCY: int = Field(default=8, env="LLM_MAX_CONCURRENCY")
+    LLM_MAX_CONNECTIONS: int = Field(default=200, env="LLM_MAX_CONNECTIONS")
+    LLM_MAX_KEEPALIVE: int = Field(default=20, env="LLM_MAX_KEEPALIVE")
     
     # Redis 설정
     REDIS_SENTINEL_HOSTS: str = Field(default="localhost:26379", env="REDIS_SENTINEL_HOSTS")
@@ -55,6 +59,13 @@ class Settings(BaseSettings):
     OPENSEARCH_TIMEOUT: int = Field(default=30, env="OPENSEARCH_TIMEOUT")
     OPENSEARCH_MAX_RETRIES: int = Field(default=3, env="OPENSEARCH_MAX_RETRIES")
     OPENSEARCH_RETRY_ON_TIMEOUT: bool = Field(default=True, env="OPENSEARCH_RETRY_ON_TIMEOUT")
+    OPENSEARCH_POOL_MAXSIZE: int = Field(default=100, env="OPENSEARCH_POOL_MAXSIZE")
+    OPENSEARCH_REFRESH_INTERVAL: str = Field(default="5s", env="OPENSEARCH_REFRESH_INTERVAL")
+    OPENSEARCH_TRANSLOG_FLUSH_THRESHOLD: str = Field(default="1gb", env="OPENSEARCH_TRANSLOG_FLUSH_THRESHOLD")
+    OPENSEARCH_INDEX_BATCH_SIZE: int = Field(default=500, env="OPENSEARCH_INDEX_BATCH_SIZE")
+    OPENSEARCH_BULK_CHUNK_SIZE: int = Field(default=500, env="OPENSEARCH_BULK_CHUNK_SIZE")
+    OPENSEARCH_INDEX_FLUSH_INTERVAL: float = Field(default=1.0, env="OPENSEARCH_INDEX_FLUSH_INTERVAL")
+    DEPARTMENT_CACHE_TTL_SECONDS: int = Field(default=60, env="DEPARTMENT_CACHE_TTL_SECONDS")
     
     # MariaDB 설정
     MARIADB_HOST: str = Field(default="localhost", env="MARIADB_HOST")
@@ -81,6 +92,9 @@ class Settings(BaseSettings):
     AUTOGEN_HUMAN_FEEDBACK: bool = Field(default=False, env="AUTOGEN_HUMAN_FEEDBACK")
     AUTOGEN_PARALLEL: bool = Field(default=True, env="AUTOGEN_PARALLEL")
     AUTOGEN_CACHE: bool = Field(default=True, env="AUTOGEN_CACHE")
+    AUTOGEN_CACHE_SEED: int = Field(default=42, env="AUTOGEN_CACHE_SEED")
+    AUTOGEN_HISTORY_MAX_MESSAGES: int = Field(default=8, env="AUTOGEN_HISTORY_MAX_MESSAGES")
+    AUTOGEN_HISTORY_MAX_TOKENS: int = Field(default=4000, env="AUTOGEN_HISTORY_MAX_TOKENS")
     
     # Langfuse 설정
     LANGFUSE_ENABLED: bool = Field(default=False, env="LANGFUSE_ENABLED")
@@ -94,6 +108,15 @@ class Settings(BaseSettings):
     LANGFUSE_FLUSH_AT: int = Field(default=100, env="LANGFUSE_FLUSH_AT")
     LANGFUSE_FLUSH_INTERVAL: int = Field(default=5, env="LANGFUSE_FLUSH_INTERVAL")
     LANGFUSE_TIMEOUT: int = Field(default=10, env="LANGFUSE_TIMEOUT")
+    MONITORING_SAMPLE_RATE: float = Field(default=1.0, env="MONITORING_SAMPLE_RATE")
+
+    # 의미 기반 LLM 캐시 설정
+    SEMANTIC_CACHE_MODEL: str = Field(
+        default="sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2",
+        env="SEMANTIC_CACHE_MODEL"
+    )
+    SEMANTIC_CACHE_THRESHOLD: float = Field(default=0.92, env="SEMANTIC_CACHE_THRESHOLD")
+    SEMANTIC_CACHE_MAXSIZE: int = Field(default=1024, env="SEMANTIC_CACHE_MAXSIZE")
     
     # Phoenix 설정
     PHOENIX_ENABLED: bool = Field(default=False, env="PHOENIX_ENABLED")
@@ -128,6 +151,7 @@ class Settings(BaseSettings):
     
     # 캐시 설정
     CACHE_TTL_SECONDS: int = Field(default=300, env="CACHE_TTL_SECONDS")
+    SEARCH_CACHE_TTL_SECONDS: int = Field(default=60, env="SEARCH_CACHE_TTL_SECONDS")
     QUERY_TIMEOUT_SECONDS: int = Field(default=15, env="QUERY_TIMEOUT_SECONDS")
     CACHE_HIT_THRESHOLD: int = Field(default=3, env="CACHE_HIT_THRESHOLD")
     CACHE_EVICTION_POLICY: str = Field(default="LFU", env="CACHE_EVICTION_POLICY")
@@ -136,9 +160,9 @@ class Settings(BaseSettings):
     # 테스트 설정
     TESTING_DATABASE_URL: Optional[str] = Field(default=None, env="TESTING_DATABASE_URL")
     
-    @property
+    @cached_property
     def database_url(self) -> str:
-        """MariaDB 연결 URL 생성"""
+        """MariaDB 연결 URL 생성 (인스턴스당 1회만 조립)"""
         return (
             f"mysql+pymysql://{self.MARIADB_USER}:{self.MARIADB_PASSWORD}"
             f"@{self.MARIADB_HOST}:{self.MARIADB_PORT}/{self.MARIADB_DATABASE}"
@@ -148,9 +172,9 @@ class Settings(BaseSettings):
             f"&write_timeout={self.MARIADB_WRITE_TIMEOUT}"
         )
     
-    @property
+    @cached_property
     def redis_sentinel_hosts(self) -> List[tuple]:
-        """Redis Sentinel 호스트 목록 파싱"""
+        """Redis Sentinel 호스트 목록 파싱 (인스턴스당 1회만 파싱)"""
         hosts = []
         for host_port in self.REDIS_SENTINEL_HOSTS.split(','):
             host, port = host_port.strip().split(':')
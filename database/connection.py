@@ -27,8 +27,13 @@ class DatabaseManager:
                 settings.database_url,
                 poolclass=QueuePool,
                 pool_size=settings.DB_CONNECTION_POOL_SIZE,
-                pool_recycle=3600,
-                pool_pre_ping=True,
+                max_overflow=settings.DB_CONNECTION_POOL_SIZE * 2,
+                # recycle 주기를 MariaDB wait_timeout보다 짧게 유지하므로
+                # 체크아웃마다 SELECT 1을 보내는 pre_ping은 불필요
+                pool_recycle=1800,
+                pool_pre_ping=False,
+                pool_use_lifo=True,
+                insertmanyvalues_page_size=1000,
                 echo=settings.DEBUG_MODE
             )
             
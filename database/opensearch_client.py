@@ -1,16 +1,22 @@
 """
 OpenSearch 클라이언트 관리
 """
-import json
 import logging
+import orjson
 from typing import Dict, List, Optional, Any
-from opensearchpy import OpenSearch, RequestsHttpConnection
-from opensearchpy.exceptions import NotFoundError, RequestError
-import certifi
 from config.settings import settings
 
+# opensearchpy/certifi는 무거운 의존성이라 실제 사용 시점에 지연 임포트한다
+# (이 모듈을 거치지 않는 스크립트의 기동 시간/메모리 절약)
+
 logger = logging.getLogger(__name__)
 
+# 쿼리마다 재사용하는 정렬 기준 (호출 시 재구성 비용 제거)
+SORT_SENTIMENT_RECENT = [
+    {"sentiment_score": {"order": "desc"}},
+    {"created_at": {"order": "desc"}}
+]
+
 
 class OpenSearchManager:
     """OpenSearch 연결 관리자"""
@@ -18,11 +24,16 @@ class OpenSearchManager:
     def __init__(self):
         self.client = None
         self.index_name = "reviews-v1"
+        # bulk 청크 크기 기본값 (calibrate_bulk_chunk_size로 재조정 가능)
+        self.bulk_chunk_size = settings.OPENSEARCH_BULK_CHUNK_SIZE
         self._initialize_client()
     
     def _initialize_client(self):
         """OpenSearch 클라이언트 초기화"""
         try:
+            from opensearchpy import OpenSearch, Urllib3HttpConnection
+            import certifi
+
             hosts = [settings.OPENSEARCH_HOSTS]
             
             self.client = OpenSearch(
@@ -33,7 +44,12 @@ class OpenSearchManager:
                 ssl_assert_hostname=settings.OPENSEARCH_SSL_ASSERT_HOSTNAME,
                 ssl_show_warn=settings.OPENSEARCH_SSL_SHOW_WARN,
                 ca_certs=certifi.where(),
-                connection_class=RequestsHttpConnection,
+                # requests 래퍼 없이 urllib3를 직접 사용 (스레드 풀에서 더 낮은 오버헤드)
+                connection_class=Urllib3HttpConnection,
+                # 연결 풀 유지 + 압축으로 프로브/검색의 TLS 핸드셰이크와 전송량 절감
+                # (풀 크기는 DB 풀과 무관한 전용 설정 - 동시 검색/인덱싱 상한)
+                pool_maxsize=settings.OPENSEARCH_POOL_MAXSIZE,
+                http_compress=True,
                 timeout=settings.OPENSEARCH_TIMEOUT,
                 max_retries=settings.OPENSEARCH_MAX_RETRIES,
                 retry_on_timeout=settings.OPENSEARCH_RETRY_ON_TIMEOUT,
@@ -68,6 +84,11 @@ class OpenSearchManager:
                 "index": {
                     "number_of_shards": 3,
                     "number_of_replicas": 1,
+                    # 잦은 refresh/flush로 인한 세그먼트 churn 완화 (수집량 위주 튜닝)
+                    "refresh_interval": settings.OPENSEARCH_REFRESH_INTERVAL,
+                    "translog": {
+                        "flush_threshold_size": settings.OPENSEARCH_TRANSLOG_FLUSH_THRESHOLD
+                    },
                     "analysis": {
                         "analyzer": {
                             "korean": {
@@ -128,16 +149,123 @@ class OpenSearchManager:
             logger.error(f"문서 인덱싱 실패 [{doc_id}]: {e}")
             return False
     
-    def search_documents(self, query: Dict[str, Any], size: int = 10) -> List[Dict[str, Any]]:
-        """문서 검색"""
+    def bulk_index_documents(self, documents: List[Dict[str, Any]],
+                             chunk_size: Optional[int] = None,
+                             index_name: Optional[str] = None) -> int:
+        """문서 일괄 인덱싱 (문서당 1회 왕복 대신 chunk_size건 단위 배치)
+
+        각 문서는 '_id'로 쓸 'id' 키를 포함해야 하며, 나머지 키가 본문이 된다.
+        index_name을 지정하면 운영 인덱스 대신 해당 인덱스로 보낸다 (측정용).
+        성공적으로 인덱싱된 문서 수를 반환한다.
+        """
+        if not self.client or not documents:
+            return 0
+
+        chunk_size = chunk_size or self.bulk_chunk_size
+        target_index = index_name or self.index_name
+
+        try:
+            from opensearchpy import helpers
+
+            actions = (
+                {
+                    "_op_type": "index",
+                    "_index": target_index,
+                    "_id": doc["id"],
+                    "_source": {k: v for k, v in doc.items() if k != "id"}
+                }
+                for doc in documents
+            )
+
+            success, errors = helpers.bulk(
+                self.client,
+                actions,
+                chunk_size=chunk_size,
+                max_chunk_bytes=50 * 1024 * 1024,
+                max_retries=3,  # 429 등 일시적 거부 재시도
+                raise_on_error=False
+            )
+
+            if errors:
+                logger.warning(f"일괄 인덱싱 부분 실패: {len(errors)}건")
+
+            logger.debug(f"일괄 인덱싱 완료: {success}건")
+            return success
+
+        except Exception as e:
+            logger.error(f"일괄 인덱싱 실패: {e}")
+            return 0
+
+    def calibrate_bulk_chunk_size(self, sample_docs: List[Dict[str, Any]],
+                                  candidates=(100, 250, 500, 1000)) -> int:
+        """샘플 문서로 청크 크기 후보를 스윕해 처리량이 최고인 값 채택
+
+        배포 환경(네트워크, 샤드 수, 문서 크기)에 따라 최적 청크가 다르므로
+        기동/시드 시점에 1회 측정해 bulk_chunk_size를 고정한다. 측정 결과는
+        로그로 남겨 OPENSEARCH_BULK_CHUNK_SIZE로 영구화할 수 있게 한다.
+        측정은 전용 스크래치 인덱스에 쓰고 끝나면 삭제하므로 운영 인덱스의
+        문서를 건드리지 않는다.
+        """
+        if not self.client or not sample_docs:
+            return self.bulk_chunk_size
+
+        scratch_index = f"{self.index_name}-calibrate"
+        best_size = self.bulk_chunk_size
+        best_rate = 0.0
+
+        try:
+            import time
+
+            for size in candidates:
+                started = time.monotonic()
+                indexed = self.bulk_index_documents(
+                    sample_docs, chunk_size=size, index_name=scratch_index
+                )
+                elapsed = time.monotonic() - started
+
+                if indexed == 0 or elapsed <= 0:
+                    continue
+
+                rate = indexed / elapsed
+                logger.info(
+                    "bulk 청크 측정: chunk_size=%d → %.0f docs/s", size, rate
+                )
+                if rate > best_rate:
+                    best_rate = rate
+                    best_size = size
+
+            if best_rate > 0:
+                self.bulk_chunk_size = best_size
+                logger.info(
+                    "bulk 청크 크기 채택: %d (OPENSEARCH_BULK_CHUNK_SIZE로 고정 가능)",
+                    best_size
+                )
+
+            return self.bulk_chunk_size
+
+        except Exception as e:
+            logger.error(f"bulk 청크 측정 실패: {e}")
+            return self.bulk_chunk_size
+
+        finally:
+            # 측정용 스크래치 인덱스 정리 (실패해도 측정 결과에는 영향 없음)
+            try:
+                self.client.indices.delete(index=scratch_index, ignore=[404])
+            except Exception as cleanup_error:
+                logger.warning(f"스크래치 인덱스 삭제 실패: {cleanup_error}")
+
+    def search_documents(self, query: Dict[str, Any], size: int = 10,
+                         includes: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """문서 검색 (includes로 필요한 _source 필드만 전송받아 페이로드 축소)"""
         if not self.client:
             return []
-        
+
         try:
             response = self.client.search(
                 index=self.index_name,
                 body=query,
-                size=size
+                size=size,
+                _source_includes=includes
             )
             
             hits = response.get('hits', {}).get('hits', [])
@@ -156,23 +284,81 @@ class OpenSearchManager:
             logger.error(f"문서 검색 실패: {e}")
             return []
     
+    def search_raw(self, query: Dict[str, Any], size: int = 10) -> Optional[bytes]:
+        """검색 결과를 OpenSearch 원본 JSON bytes로 반환
+
+        히트 목록을 파이썬 dict로 재구성하지 않고 커넥션 레벨 응답을
+        그대로 돌려줘 역직렬화+재직렬화 한 쌍을 생략한다. 응답을 가공
+        없이 HTTP로 흘려보내는 읽기 전용 엔드포인트용.
+        """
+        if not self.client:
+            return None
+
+        try:
+            status, _headers, raw = self.client.transport.get_connection().perform_request(
+                "POST",
+                f"/{self.index_name}/_search",
+                params={"size": size},
+                body=orjson.dumps(query),
+                headers={"content-type": "application/json"}
+            )
+
+            if status >= 300:
+                logger.error(f"원본 검색 실패: HTTP {status}")
+                return None
+
+            return raw.encode() if isinstance(raw, str) else raw
+
+        except Exception as e:
+            logger.error(f"원본 검색 실패: {e}")
+            return None
+
+    def msearch(self, queries: List[Dict[str, Any]], size: int = 10) -> List[List[Dict[str, Any]]]:
+        """여러 검색 쿼리를 한 번의 _msearch 왕복으로 실행"""
+        if not self.client or not queries:
+            return [[] for _ in queries]
+
+        try:
+            # NDJSON 형식: 쿼리마다 헤더 라인 + 본문 라인
+            body = []
+            for query in queries:
+                body.append({"index": self.index_name})
+                body.append({**query, "size": size})
+
+            response = self.client.msearch(body=body)
+
+            results = []
+            for item in response.get('responses', []):
+                hits = item.get('hits', {}).get('hits', [])
+                query_results = []
+                for hit in hits:
+                    result = hit['_source']
+                    result['_id'] = hit['_id']
+                    result['_score'] = hit['_score']
+                    query_results.append(result)
+                results.append(query_results)
+
+            logger.debug(f"msearch 완료: {len(queries)}개 쿼리를 1회 왕복으로 처리")
+            return results
+
+        except Exception as e:
+            logger.error(f"msearch 실패: {e}")
+            return [[] for _ in queries]
+
     def search_reviews_by_content(self, content: str, size: int = 10) -> List[Dict[str, Any]]:
-        """리뷰 내용으로 검색"""
+        """리뷰 내용으로 검색
+
+        content 필드는 매핑에서 이미 korean 분석기에 묶여 있고 기본 정렬이
+        _score 내림차순이므로, 쿼리에 분석기/정렬을 다시 지정하지 않는다.
+        """
         query = {
             "query": {
                 "match": {
-                    "content": {
-                        "query": content,
-                        "analyzer": "korean"
-                    }
+                    "content": content
                 }
-            },
-            "sort": [
-                {"_score": {"order": "desc"}},
-                {"created_at": {"order": "desc"}}
-            ]
+            }
         }
-        
+
         return self.search_documents(query, size)
     
     def search_reviews_by_sentiment(self, sentiment: str, size: int = 10) -> List[Dict[str, Any]]:
@@ -183,19 +369,18 @@ class OpenSearchManager:
                     "sentiment": sentiment
                 }
             },
-            "sort": [
-                {"sentiment_score": {"order": "desc"}},
-                {"created_at": {"order": "desc"}}
-            ]
+            "sort": SORT_SENTIMENT_RECENT
         }
-        
+
         return self.search_documents(query, size)
     
     def delete_document(self, doc_id: str) -> bool:
         """문서 삭제"""
         if not self.client:
             return False
-        
+
+        from opensearchpy.exceptions import NotFoundError
+
         try:
             response = self.client.delete(
                 index=self.index_name,
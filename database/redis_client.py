@@ -1,23 +1,53 @@
 """
 Redis 클라이언트 관리
 """
-import json
 import logging
-from typing import Any, Optional, List
+import queue
+import threading
+import time
+import orjson
+from typing import Any, Callable, Optional, List
 import redis
+from redis.backoff import NoBackoff
+from redis.exceptions import ConnectionError as RedisConnectionError, ReadOnlyError
+from redis.retry import Retry
 from redis.sentinel import Sentinel
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
 
+def _dumps(value: Any) -> bytes:
+    """캐시 페이로드 직렬화
+
+    orjson은 naive datetime을 UTC로 간주해 ISO 8601로 직렬화하고,
+    그 외 비JSON 타입(Decimal 등)은 str로 강등해 직렬화 실패로 캐시
+    저장이 통째로 빠지는 일을 막는다.
+    """
+    return orjson.dumps(value, option=orjson.OPT_NAIVE_UTC, default=str)
+
+
 class RedisManager:
     """Redis 연결 관리자"""
     
+    # write-behind 큐 용량과 1회 파이프라인으로 묶는 최대 SET 수
+    WRITE_QUEUE_MAXSIZE = 10000
+    WRITE_BATCH_SIZE = 256
+
     def __init__(self):
         self.sentinel = None
         self.redis_client = None
         self._initialize_client()
+
+        # 캐시 쓰기는 best-effort이므로 백그라운드 스레드가 파이프라인으로
+        # 몰아서 처리 (호출자는 RTT를 기다리지 않음)
+        self._write_queue = queue.Queue(maxsize=self.WRITE_QUEUE_MAXSIZE)
+        self._write_worker = threading.Thread(
+            target=self._drain_write_queue,
+            name="redis-write-behind",
+            daemon=True
+        )
+        self._write_worker.start()
     
     def _initialize_client(self):
         """Redis 클라이언트 초기화"""
@@ -29,13 +59,18 @@ class RedisManager:
                 socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT
             )
             
-            # Master 연결
+            # Master 연결 (인스턴스는 한 번만 생성해 재사용 - 호출마다 Sentinel 조회 방지)
             self.redis_client = self.sentinel.master_for(
                 settings.REDIS_SENTINEL_SERVICE_NAME,
                 socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+                socket_keepalive=True,
+                max_connections=settings.REDIS_MAX_CONNECTIONS,
+                # 유휴 연결의 생존 확인 + 페일오버 직후 끊긴 연결/읽기 전용 오류 1회 재시도
+                health_check_interval=30,
+                retry=Retry(NoBackoff(), 1),
+                retry_on_error=[RedisConnectionError, ReadOnlyError],
                 password=settings.REDIS_PASSWORD,
-                db=settings.REDIS_DB,
-                decode_responses=True
+                db=settings.REDIS_DB
             )
             
             logger.info("Redis 클라이언트 초기화 완료")
@@ -50,9 +85,13 @@ class RedisManager:
                     port=port,
                     password=settings.REDIS_PASSWORD,
                     db=settings.REDIS_DB,
-                    decode_responses=True,
                     socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
-                    socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT
+                    socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+                    socket_keepalive=True,
+                    health_check_interval=30,
+                    retry=Retry(NoBackoff(), 1),
+                    retry_on_error=[RedisConnectionError],
+                    max_connections=settings.REDIS_MAX_CONNECTIONS
                 )
                 logger.info("단일 Redis 연결 완료")
             except Exception as fallback_error:
@@ -73,20 +112,74 @@ class RedisManager:
             return False
     
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
-        """값 저장"""
+        """값 저장 (write-behind)
+
+        dict/list는 orjson으로 인코딩하고, bytes/str은 이미 직렬화된
+        페이로드로 간주해 재인코딩 없이 그대로 저장한다. 캐시 쓰기는
+        best-effort이므로 큐에 넣고 즉시 반환하며, 실제 SETEX는
+        백그라운드 워커가 파이프라인으로 일괄 수행한다. 쓰기 직후
+        조회가 필요한 경로는 set_sync를 사용할 것.
+        """
         if not self.redis_client:
             return False
-        
+
         try:
             if isinstance(value, (dict, list)):
-                value = json.dumps(value, ensure_ascii=False)
-            
+                # orjson은 bytes를 바로 반환하므로 str 왕복 없이 저장
+                value = _dumps(value)
+
+            ttl = ttl or settings.CACHE_TTL_SECONDS
+            self._write_queue.put_nowait((key, value, ttl))
+            return True
+        except queue.Full:
+            # 큐 포화 시에는 동기 쓰기로 폴백 (캐시 유실 방지)
+            logger.warning(f"write-behind 큐 포화, 동기 저장 폴백 [{key}]")
+            return self.set_sync(key, value, ttl)
+        except Exception as e:
+            logger.error(f"Redis SET 오류 [{key}]: {e}")
+            return False
+
+    def set_sync(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        """값 동기 저장 (쓰기 완료 후 반환)
+
+        write-behind 큐를 거치지 않으므로 쓰기 직후 조회가 일어나거나
+        (get_or_build) 값이 캐시가 아니라 시스템 오브 레코드인 경로
+        (작업 상태 등)는 set 대신 이쪽을 사용할 것.
+        """
+        if not self.redis_client:
+            return False
+
+        try:
+            if isinstance(value, (dict, list)):
+                value = _dumps(value)
+
             ttl = ttl or settings.CACHE_TTL_SECONDS
             self.redis_client.setex(key, ttl, value)
             return True
         except Exception as e:
             logger.error(f"Redis SET 오류 [{key}]: {e}")
             return False
+
+    def _drain_write_queue(self):
+        """큐에 쌓인 SET을 WRITE_BATCH_SIZE 단위 파이프라인으로 비우는 워커"""
+        while True:
+            batch = [self._write_queue.get()]
+            while len(batch) < self.WRITE_BATCH_SIZE:
+                try:
+                    batch.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                pipe = self.redis_client.pipeline(transaction=False)
+                for key, value, ttl in batch:
+                    pipe.setex(key, ttl, value)
+                pipe.execute()
+            except Exception as e:
+                logger.error(f"write-behind 플러시 오류 ({len(batch)}건): {e}")
+            finally:
+                for _ in batch:
+                    self._write_queue.task_done()
     
     def get(self, key: str) -> Optional[Any]:
         """값 조회"""
@@ -97,17 +190,149 @@ class RedisManager:
             value = self.redis_client.get(key)
             if value is None:
                 return None
-            
-            # JSON 파싱 시도
+
+            # JSON 파싱 시도 (JSON이 아니면 문자열로 반환)
             try:
-                return json.loads(value)
-            except (json.JSONDecodeError, TypeError):
-                return value
+                return orjson.loads(value)
+            except orjson.JSONDecodeError:
+                return value.decode() if isinstance(value, bytes) else value
                 
         except Exception as e:
             logger.error(f"Redis GET 오류 [{key}]: {e}")
             return None
     
+    def pipeline(self):
+        """트랜잭션 없는 파이프라인 반환 (여러 명령을 1회 왕복으로 실행)"""
+        if not self.redis_client:
+            return None
+
+        return self.redis_client.pipeline(transaction=False)
+
+    # 한 번의 MGET으로 조회할 최대 키 수 (응답 크기/지연 상한)
+    MGET_CHUNK_SIZE = 1000
+
+    def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        """여러 키를 조회 (MGET_CHUNK_SIZE 단위로 끊어 왕복 수를 최소화)"""
+        if not self.redis_client or not keys:
+            return [None] * len(keys)
+
+        try:
+            results = []
+            for start in range(0, len(keys), self.MGET_CHUNK_SIZE):
+                chunk = keys[start:start + self.MGET_CHUNK_SIZE]
+                for value in self.redis_client.mget(chunk):
+                    if value is None:
+                        results.append(None)
+                        continue
+                    try:
+                        results.append(orjson.loads(value))
+                    except orjson.JSONDecodeError:
+                        results.append(value.decode() if isinstance(value, bytes) else value)
+            return results
+        except Exception as e:
+            logger.error(f"Redis MGET 오류 [{keys}]: {e}")
+            return [None] * len(keys)
+
+    def mset(self, mapping: dict, ttl: Optional[int] = None) -> bool:
+        """여러 키를 파이프라인 1회 왕복으로 저장 (TTL 적용)"""
+        if not self.redis_client or not mapping:
+            return False
+
+        try:
+            ttl = ttl or settings.CACHE_TTL_SECONDS
+            pipe = self.redis_client.pipeline(transaction=False)
+            for key, value in mapping.items():
+                if isinstance(value, (dict, list)):
+                    value = _dumps(value)
+                pipe.setex(key, ttl, value)
+            pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Redis MSET 오류: {e}")
+            return False
+
+    def get_or_build(self, key: str, builder: Callable[[], Any],
+                     ttl: Optional[int] = None,
+                     lock_timeout_ms: int = 5000,
+                     wait_seconds: float = 0.05,
+                     max_wait_seconds: float = 5.0) -> Any:
+        """캐시 조회 후 미스 시 단일 요청만 builder를 실행 (thundering-herd 방지)
+
+        미스가 발생하면 `SET NX PX` 락을 먼저 잡은 요청만 builder를 실행해
+        결과를 캐시에 채우고, 나머지 요청은 캐시가 채워질 때까지 짧게 폴링한다.
+        """
+        if not self.redis_client:
+            return builder()
+
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        lock_key = f"lock:{key}"
+        deadline = time.monotonic() + max_wait_seconds
+
+        while True:
+            try:
+                acquired = self.redis_client.set(lock_key, "1", nx=True, px=lock_timeout_ms)
+            except Exception as e:
+                logger.error(f"Redis 락 획득 오류 [{key}]: {e}")
+                return builder()
+
+            if acquired:
+                try:
+                    value = builder()
+                    if value is not None:
+                        # 락 해제 전에 캐시가 채워져야 대기 요청이 값을 보므로 동기 저장
+                        self.set_sync(key, value, ttl)
+                    return value
+                finally:
+                    self.delete(lock_key)
+
+            # 다른 요청이 빌드 중 - 캐시가 채워질 때까지 대기
+            time.sleep(wait_seconds)
+            value = self.get(key)
+            if value is not None:
+                return value
+
+            if time.monotonic() > deadline:
+                logger.warning(f"캐시 락 대기 시간 초과, 직접 빌드 수행 [{key}]")
+                return builder()
+
+    def get_or_init(self, key: str, default: int) -> int:
+        """정수 키를 조회하고, 없으면 기본값으로 초기화해 반환
+
+        키가 이미 있는 일반 경로는 GET 1회로 끝나고, 미스일 때만
+        SET NX + GET을 파이프라인 1회 왕복으로 묶어 초기화한다
+        (NX라 경쟁 시에도 먼저 쓴 값이 유지됨).
+        """
+        if not self.redis_client:
+            return default
+
+        try:
+            value = self.redis_client.get(key)
+            if value is not None:
+                return int(value)
+
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.set(key, default, nx=True)
+            pipe.get(key)
+            value = pipe.execute()[1]
+            return int(value) if value is not None else default
+        except Exception as e:
+            logger.error(f"Redis GET/INIT 오류 [{key}]: {e}")
+            return default
+
+    def incr(self, key: str) -> Optional[int]:
+        """정수 키를 1 증가 (O(1) 단일 명령)"""
+        if not self.redis_client:
+            return None
+
+        try:
+            return self.redis_client.incr(key)
+        except Exception as e:
+            logger.error(f"Redis INCR 오류 [{key}]: {e}")
+            return None
+
     def delete(self, key: str) -> bool:
         """값 삭제"""
         if not self.redis_client:
@@ -120,6 +345,50 @@ class RedisManager:
             logger.error(f"Redis DELETE 오류 [{key}]: {e}")
             return False
     
+    # 패턴 무효화 시 한 번의 파이프라인으로 UNLINK할 최대 키 수
+    INVALIDATE_BATCH_SIZE = 500
+
+    def invalidate_many(self, pattern: str) -> int:
+        """패턴에 매칭되는 키를 일괄 삭제
+
+        SCAN으로 순회하며 INVALIDATE_BATCH_SIZE 단위로 파이프라인에 묶어
+        UNLINK하므로 키당 1회 왕복 대신 배치당 1회 왕복으로 끝난다.
+        파이프라인 실패 시에는 순차 삭제로 폴백한다.
+        """
+        if not self.redis_client:
+            return 0
+
+        deleted = 0
+        try:
+            batch = []
+            for key in self.redis_client.scan_iter(match=pattern, count=1000):
+                batch.append(key)
+                if len(batch) >= self.INVALIDATE_BATCH_SIZE:
+                    deleted += self._unlink_batch(batch)
+                    batch = []
+
+            if batch:
+                deleted += self._unlink_batch(batch)
+
+            return deleted
+        except Exception as e:
+            logger.error(f"Redis 일괄 무효화 오류 [{pattern}]: {e}")
+            return deleted
+
+    def _unlink_batch(self, batch: List[Any]) -> int:
+        """키 배치를 파이프라인 1회 왕복으로 UNLINK (실패 시 순차 삭제 폴백)"""
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.unlink(*batch)
+            return sum(pipe.execute())
+        except Exception as e:
+            logger.warning(f"일괄 UNLINK 실패, 순차 삭제 폴백 ({len(batch)}건): {e}")
+            deleted = 0
+            for key in batch:
+                if self.delete(key):
+                    deleted += 1
+            return deleted
+
     def exists(self, key: str) -> bool:
         """키 존재 확인"""
         if not self.redis_client:
@@ -132,12 +401,15 @@ class RedisManager:
             return False
     
     def keys(self, pattern: str = "*") -> List[str]:
-        """키 목록 조회"""
+        """키 목록 조회 (서버를 블로킹하는 KEYS 대신 SCAN으로 순회)"""
         if not self.redis_client:
             return []
-        
+
         try:
-            return self.redis_client.keys(pattern)
+            return [
+                key.decode() if isinstance(key, bytes) else key
+                for key in self.redis_client.scan_iter(match=pattern, count=1000)
+            ]
         except Exception as e:
             logger.error(f"Redis KEYS 오류 [{pattern}]: {e}")
             return []
@@ -0,0 +1,26 @@
+"""
+Gunicorn 설정 파일 (운영용)
+
+실행: gunicorn -c gunicorn.conf.py
+
+gevent 워커가 monkey patching을 수행하므로 MariaDB/Redis/OpenSearch/LLM에
+대한 블로킹 네트워크 호출이 greenlet 단위로 양보되어, 긴 LLM 호출이
+다른 요청을 막지 않는다. `python app.py`는 로컬 개발용으로 유지된다.
+"""
+import multiprocessing
+
+from config.settings import settings
+
+wsgi_app = "app:create_app()"
+bind = f"0.0.0.0:{settings.BACKEND_PORT}"
+worker_class = "gevent"
+workers = multiprocessing.cpu_count()
+worker_connections = 1000
+timeout = settings.AUTOGEN_TIMEOUT
+accesslog = "-" if settings.DEBUG_MODE else None
+
+
+def post_worker_init(worker):
+    """워커별 서비스 초기화 (연결 테스트 및 테이블 생성)"""
+    from app import initialize_services
+    initialize_services()
@@ -3,9 +3,9 @@
 """
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import Column, Integer, BigInteger, String, Text, DateTime, Boolean, Float, ForeignKey, Enum, JSON
+from sqlalchemy import Column, Index, Integer, BigInteger, String, Text, DateTime, Boolean, Float, ForeignKey, JSON
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 import enum
 
 Base = declarative_base()
@@ -24,6 +24,11 @@ class SentimentEnum(enum.Enum):
     NEUTRAL = "neutral"
 
 
+# 쓰기 시 검증용 허용 값 집합 (컬럼은 평문 문자열로 저장)
+_PLATFORM_VALUES = frozenset(member.value for member in PlatformEnum)
+_SENTIMENT_VALUES = frozenset(member.value for member in SentimentEnum)
+
+
 class FinancialCompany(Base):
     """금융사 테이블"""
     __tablename__ = 'financial_companies'
@@ -56,31 +61,63 @@ class Review(Base):
     content = Column(Text, nullable=False)
     rating = Column(Integer)  # 1-5
     review_date = Column(DateTime)
-    platform = Column(Enum(PlatformEnum), nullable=False)
-    sentiment = Column(Enum(SentimentEnum))
+    # Enum 타입 대신 평문 문자열 저장 (값 매핑/역매핑 오버헤드 제거, 인덱스로 필터 지원)
+    platform = Column(String(16), nullable=False, index=True)
+    sentiment = Column(String(16), index=True)
     sentiment_score = Column(Float)
     department_assigned = Column(String(100))
     processed = Column(Boolean, default=False)
     created_at = Column(DateTime, default=datetime.utcnow)
-    
-    # 관계 설정
+
+    # 목록 조회의 필터+최신순 정렬을 인덱스 스캔으로 처리하기 위한
+    # 복합 인덱스 (필터 후 별도 정렬 단계 제거)
+    __table_args__ = (
+        Index('ix_review_company_sentiment_created',
+              'company_id', 'sentiment', 'created_at'),
+        Index('ix_review_dept_created',
+              'department_assigned', 'created_at'),
+    )
+
+    # 관계 설정 (관계를 실제로 순회하는 읽기 쿼리에서는
+    # selectinload(Review.company) 옵션으로 N+1을 방지할 것)
     company = relationship("FinancialCompany", back_populates="reviews")
     agent_logs = relationship("AgentLog", back_populates="review", cascade="all, delete-orphan")
-    
+
+    @validates('platform')
+    def _validate_platform(self, key, value):
+        """쓰기 시에만 플랫폼 값 검증 (enum 멤버는 문자열로 변환)"""
+        if isinstance(value, PlatformEnum):
+            return value.value
+        if value not in _PLATFORM_VALUES:
+            raise ValueError(f"유효하지 않은 플랫폼 값: {value}")
+        return value
+
+    @validates('sentiment')
+    def _validate_sentiment(self, key, value):
+        """쓰기 시에만 감정 값 검증 (enum 멤버는 문자열로 변환)"""
+        if value is None:
+            return None
+        if isinstance(value, SentimentEnum):
+            return value.value
+        if value not in _SENTIMENT_VALUES:
+            raise ValueError(f"유효하지 않은 감정 값: {value}")
+        return value
+
+    # to_dict가 순회할 컬럼 목록 (클래스 로드 시 1회만 구성)
+    _DICT_COLS = ('id', 'company_id', 'content', 'rating', 'platform',
+                  'sentiment', 'sentiment_score', 'department_assigned',
+                  'processed')
+    _DICT_DATE_COLS = ('review_date', 'created_at')
+
     def to_dict(self):
-        return {
-            'id': self.id,
-            'company_id': self.company_id,
-            'content': self.content,
-            'rating': self.rating,
-            'review_date': self.review_date.isoformat() if self.review_date else None,
-            'platform': self.platform.value if self.platform else None,
-            'sentiment': self.sentiment.value if self.sentiment else None,
-            'sentiment_score': self.sentiment_score,
-            'department_assigned': self.department_assigned,
-            'processed': self.processed,
-            'created_at': self.created_at.isoformat() if self.created_at else None
-        }
+        # 목록 조회 루프에서 호출되므로 dict 리터럴 대신 사전 계산된
+        # 컬럼 튜플 순회로 구성 (날짜 컬럼만 isoformat 분기)
+        get = self.__getattribute__
+        data = {col: get(col) for col in self._DICT_COLS}
+        for col in self._DICT_DATE_COLS:
+            value = get(col)
+            data[col] = value.isoformat() if value else None
+        return data
 
 
 class Department(Base):
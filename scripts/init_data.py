@@ -8,6 +8,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import logging
 from datetime import datetime, timedelta
+from sqlalchemy import insert, select
 from database.connection import db_manager
 from models.database import FinancialCompany, Department, Review, PlatformEnum
 from utils.logger import setup_logging
@@ -49,21 +50,18 @@ def create_sample_companies():
     
     try:
         with db_manager.get_session() as session:
-            for company_data in companies_data:
-                # 중복 확인
-                existing = session.query(FinancialCompany).filter_by(
-                    app_id=company_data['app_id']
-                ).first()
-                
-                if not existing:
-                    company = FinancialCompany(**company_data)
-                    session.add(company)
-                    logger.info(f"금융사 생성: {company_data['name']}")
-                else:
-                    logger.info(f"금융사 이미 존재: {company_data['name']}")
-            
+            # app_id UNIQUE 제약을 이용한 INSERT IGNORE 한 방으로
+            # 사전 SELECT 없이 멱등하게 일괄 생성 (중복 행은 조용히 건너뜀)
+            result = session.execute(
+                insert(FinancialCompany).prefix_with('IGNORE'),
+                companies_data
+            )
+
             session.commit()
-            logger.info("샘플 금융사 생성 완료")
+            logger.info(
+                f"샘플 금융사 생성 완료: {result.rowcount}건 신규 "
+                f"(요청 {len(companies_data)}건)"
+            )
             
     except Exception as e:
         logger.error(f"샘플 금융사 생성 오류: {e}")
@@ -101,19 +99,32 @@ def create_sample_departments():
     
     try:
         with db_manager.get_session() as session:
-            for dept_data in departments_data:
-                # 중복 확인
-                existing = session.query(Department).filter_by(
-                    name=dept_data['name']
-                ).first()
-                
-                if not existing:
-                    department = Department(**dept_data)
-                    session.add(department)
-                    logger.info(f"부서 생성: {dept_data['name']}")
+            # 중복 확인을 단일 IN 쿼리로 수행
+            existing_names = set(
+                session.execute(
+                    select(Department.name).where(
+                        Department.name.in_(
+                            [dept['name'] for dept in departments_data]
+                        )
+                    )
+                ).scalars()
+            )
+
+            new_departments = [
+                dept for dept in departments_data
+                if dept['name'] not in existing_names
+            ]
+
+            for dept in departments_data:
+                if dept['name'] in existing_names:
+                    logger.info(f"부서 이미 존재: {dept['name']}")
                 else:
-                    logger.info(f"부서 이미 존재: {dept_data['name']}")
-            
+                    logger.info(f"부서 생성: {dept['name']}")
+
+            # 단일 멀티로우 INSERT로 일괄 생성
+            if new_departments:
+                session.execute(insert(Department), new_departments)
+
             session.commit()
             logger.info("샘플 부서 생성 완료")
             
@@ -127,27 +138,27 @@ def create_sample_reviews():
         {
             'content': '앱이 정말 편리하고 사용하기 쉬워요. 특히 송금 기능이 빠르고 간편합니다.',
             'rating': 5,
-            'platform': PlatformEnum.GOOGLE_PLAY
+            'platform': PlatformEnum.GOOGLE_PLAY.value
         },
         {
             'content': '로그인이 자꾸 안되고 앱이 느려요. 개선이 필요합니다.',
             'rating': 2,
-            'platform': PlatformEnum.APP_STORE
+            'platform': PlatformEnum.APP_STORE.value
         },
         {
             'content': '고객센터 응답이 너무 늦어요. 문의한지 3일이 지났는데 답변이 없네요.',
             'rating': 1,
-            'platform': PlatformEnum.GOOGLE_PLAY
+            'platform': PlatformEnum.GOOGLE_PLAY.value
         },
         {
             'content': '새로운 기능들이 계속 추가되어서 좋아요. 특히 가계부 기능이 유용합니다.',
             'rating': 4,
-            'platform': PlatformEnum.APP_STORE
+            'platform': PlatformEnum.APP_STORE.value
         },
         {
             'content': '보안이 강화되어서 안심이 되지만, 인증 과정이 너무 복잡해요.',
             'rating': 3,
-            'platform': PlatformEnum.GOOGLE_PLAY
+            'platform': PlatformEnum.GOOGLE_PLAY.value
         }
     ]
     
@@ -159,18 +170,22 @@ def create_sample_reviews():
                 logger.error("샘플 리뷰 생성을 위한 회사가 없습니다")
                 return
             
-            for i, review_data in enumerate(reviews_data):
-                review = Review(
-                    company_id=company.id,
-                    content=review_data['content'],
-                    rating=review_data['rating'],
-                    platform=review_data['platform'],
-                    review_date=datetime.utcnow() - timedelta(days=i)
-                )
-                
-                session.add(review)
+            # 단일 멀티로우 INSERT로 일괄 생성
+            rows = [
+                {
+                    'company_id': company.id,
+                    'content': review_data['content'],
+                    'rating': review_data['rating'],
+                    'platform': review_data['platform'],
+                    'review_date': datetime.utcnow() - timedelta(days=i)
+                }
+                for i, review_data in enumerate(reviews_data)
+            ]
+
+            for review_data in reviews_data:
                 logger.info(f"리뷰 생성: {review_data['content'][:30]}...")
-            
+
+            session.execute(insert(Review), rows)
             session.commit()
             logger.info("샘플 리뷰 생성 완료")
             
@@ -178,6 +193,40 @@ def create_sample_reviews():
         logger.error(f"샘플 리뷰 생성 오류: {e}")
 
 
+def calibrate_opensearch_bulk():
+    """OpenSearch bulk 청크 크기 측정 (리뷰가 충분할 때만)"""
+    try:
+        from database.opensearch_client import opensearch_manager
+
+        if not opensearch_manager.test_connection():
+            logger.info("OpenSearch 미연결, bulk 청크 측정 건너뜀")
+            return
+
+        with db_manager.get_session() as session:
+            rows = session.execute(
+                select(
+                    Review.id,
+                    Review.company_id,
+                    Review.content,
+                    Review.rating,
+                    Review.platform,
+                    Review.sentiment,
+                    Review.sentiment_score
+                ).limit(1000)
+            ).mappings().all()
+
+        # 표본이 너무 작으면 측정값이 의미 없으므로 기본값 유지
+        if len(rows) < 100:
+            logger.info(f"리뷰 표본 부족({len(rows)}건), bulk 청크 측정 건너뜀")
+            return
+
+        sample_docs = [dict(row, id=str(row['id'])) for row in rows]
+        opensearch_manager.calibrate_bulk_chunk_size(sample_docs)
+
+    except Exception as e:
+        logger.error(f"bulk 청크 측정 오류: {e}")
+
+
 def main():
     """메인 함수"""
     logger.info("초기 데이터 생성 시작...")
@@ -195,7 +244,10 @@ def main():
         create_sample_companies()
         create_sample_departments()
         create_sample_reviews()
-        
+
+        # 시드 후 인덱싱 처리량 기준으로 bulk 청크 크기 1회 측정
+        calibrate_opensearch_bulk()
+
         logger.info("초기 데이터 생성 완료")
         
     except Exception as e:
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+리뷰 플랫폼/감정 컬럼 마이그레이션 스크립트
+
+기존 배포의 reviews 테이블은 SQLAlchemy Enum 컬럼이 만든 MySQL ENUM
+타입에 멤버 이름("GOOGLE_PLAY", "POSITIVE")을 저장한다. 모델이 평문
+String(16) 컬럼에 소문자 값("google_play", "positive")을 쓰도록 바뀐
+뒤에는 create_all이 기존 테이블을 바꿔주지 않으므로, 이 스크립트로
+컬럼 타입 변경 + 이름→값 백필 + 신규 인덱스 생성을 수행한다.
+여러 번 실행해도 안전하다 (이미 적용된 단계는 건너뜀).
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import logging
+from sqlalchemy import text
+from database.connection import db_manager
+from models.database import PlatformEnum, SentimentEnum
+from utils.logger import setup_logging
+
+# 로깅 설정
+setup_logging()
+logger = logging.getLogger(__name__)
+
+# 마이그레이션으로 보장해야 하는 인덱스 (이름, 컬럼 목록)
+REQUIRED_INDEXES = [
+    ('ix_reviews_platform', 'platform'),
+    ('ix_reviews_sentiment', 'sentiment'),
+    ('ix_review_company_sentiment_created', 'company_id, sentiment, created_at'),
+    ('ix_review_dept_created', 'department_assigned, created_at'),
+]
+
+
+def _column_type(conn, column: str) -> str:
+    """reviews 테이블 컬럼의 현재 타입 조회 (예: "enum('GOOGLE_PLAY',...)")"""
+    row = conn.execute(
+        text(
+            "SELECT COLUMN_TYPE FROM information_schema.COLUMNS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'reviews' "
+            "AND COLUMN_NAME = :column"
+        ),
+        {"column": column}
+    ).scalar()
+    return (row or '').lower()
+
+
+def _index_exists(conn, index_name: str) -> bool:
+    """reviews 테이블에 인덱스가 이미 있는지 확인"""
+    count = conn.execute(
+        text(
+            "SELECT COUNT(*) FROM information_schema.STATISTICS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'reviews' "
+            "AND INDEX_NAME = :index_name"
+        ),
+        {"index_name": index_name}
+    ).scalar()
+    return bool(count)
+
+
+def migrate_column_types(conn):
+    """ENUM 컬럼을 VARCHAR(16)으로 변경 (이름→값 UPDATE가 가능해짐)"""
+    platform_type = _column_type(conn, 'platform')
+    if platform_type.startswith('enum'):
+        logger.info("platform 컬럼 타입 변경: %s → varchar(16)", platform_type)
+        conn.execute(text(
+            "ALTER TABLE reviews MODIFY platform VARCHAR(16) NOT NULL"
+        ))
+    else:
+        logger.info("platform 컬럼 타입 이미 적용됨: %s", platform_type)
+
+    sentiment_type = _column_type(conn, 'sentiment')
+    if sentiment_type.startswith('enum'):
+        logger.info("sentiment 컬럼 타입 변경: %s → varchar(16)", sentiment_type)
+        conn.execute(text(
+            "ALTER TABLE reviews MODIFY sentiment VARCHAR(16) NULL"
+        ))
+    else:
+        logger.info("sentiment 컬럼 타입 이미 적용됨: %s", sentiment_type)
+
+
+def backfill_member_names(conn):
+    """기존 행의 멤버 이름을 소문자 값으로 재기록"""
+    for column, members in (
+        ('platform', PlatformEnum),
+        ('sentiment', SentimentEnum),
+    ):
+        for member in members:
+            result = conn.execute(
+                text(
+                    f"UPDATE reviews SET {column} = :value "
+                    f"WHERE {column} = :name"
+                ),
+                {"value": member.value, "name": member.name}
+            )
+            if result.rowcount:
+                logger.info(
+                    "%s 백필: %s → %s (%d행)",
+                    column, member.name, member.value, result.rowcount
+                )
+
+
+def create_missing_indexes(conn):
+    """모델에 선언된 인덱스 중 기존 테이블에 없는 것 생성"""
+    for index_name, columns in REQUIRED_INDEXES:
+        if _index_exists(conn, index_name):
+            logger.info("인덱스 이미 존재: %s", index_name)
+            continue
+
+        logger.info("인덱스 생성: %s (%s)", index_name, columns)
+        conn.execute(text(
+            f"CREATE INDEX {index_name} ON reviews ({columns})"
+        ))
+
+
+def main():
+    """메인 함수"""
+    logger.info("리뷰 컬럼 마이그레이션 시작...")
+
+    try:
+        if not db_manager.test_connection():
+            logger.error("데이터베이스 연결 실패")
+            sys.exit(1)
+
+        with db_manager.engine.begin() as conn:
+            migrate_column_types(conn)
+            backfill_member_names(conn)
+            create_missing_indexes(conn)
+
+        logger.info("리뷰 컬럼 마이그레이션 완료")
+
+    except Exception as e:
+        logger.error(f"마이그레이션 오류: {e}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
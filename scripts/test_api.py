@@ -3,6 +3,9 @@
 API 테스트 스크립트
 """
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 import json
 import sys
 from datetime import datetime
@@ -10,12 +13,20 @@ from datetime import datetime
 
 BASE_URL = "http://localhost:2400/api"
 
+# 연결 풀을 공유하는 세션 (테스트 전체에서 TCP 핸드셰이크 재사용)
+_session = requests.Session()
+_session.mount("http://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.1)
+))
+
 
 def test_health():
     """헬스 체크 테스트"""
     print("=== 헬스 체크 테스트 ===")
     try:
-        response = requests.get(f"{BASE_URL}/health")
+        response = _session.get(f"{BASE_URL}/health")
         print(f"Status: {response.status_code}")
         print(f"Response: {response.json()}")
         return response.status_code == 200
@@ -30,7 +41,7 @@ def test_companies():
     
     # 금융사 목록 조회
     try:
-        response = requests.get(f"{BASE_URL}/companies")
+        response = _session.get(f"{BASE_URL}/companies")
         print(f"GET /companies - Status: {response.status_code}")
         companies = response.json()
         print(f"Companies count: {len(companies.get('data', []))}")
@@ -48,20 +59,24 @@ def test_reviews(company_id):
     """리뷰 API 테스트"""
     print("\n=== 리뷰 API 테스트 ===")
     
-    # 리뷰 목록 조회
+    # 전체/회사별 리뷰 목록을 병렬 조회 (독립 요청이라 총 시간 = 최대 1건)
+    urls = [f"{BASE_URL}/reviews"]
+    if company_id:
+        urls.append(f"{BASE_URL}/reviews?company_id={company_id}")
+
     try:
-        response = requests.get(f"{BASE_URL}/reviews")
-        print(f"GET /reviews - Status: {response.status_code}")
-        reviews = response.json()
+        with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+            responses = list(executor.map(_session.get, urls))
+
+        print(f"GET /reviews - Status: {responses[0].status_code}")
+        reviews = responses[0].json()
         print(f"Reviews count: {len(reviews.get('data', []))}")
-        
-        # 특정 회사 리뷰 조회
+
         if company_id:
-            response = requests.get(f"{BASE_URL}/reviews?company_id={company_id}")
-            print(f"GET /reviews?company_id={company_id} - Status: {response.status_code}")
-            company_reviews = response.json()
+            print(f"GET /reviews?company_id={company_id} - Status: {responses[1].status_code}")
+            company_reviews = responses[1].json()
             print(f"Company reviews count: {len(company_reviews.get('data', []))}")
-        
+
     except Exception as e:
         print(f"Error: {e}")
 
@@ -70,20 +85,24 @@ def test_sentiment_stats(company_id):
     """감정 통계 API 테스트"""
     print("\n=== 감정 통계 API 테스트 ===")
     
+    # 전체/회사별 감정 통계를 병렬 조회
+    urls = [f"{BASE_URL}/reviews/sentiment-stats"]
+    if company_id:
+        urls.append(f"{BASE_URL}/reviews/sentiment-stats?company_id={company_id}")
+
     try:
-        # 전체 감정 통계
-        response = requests.get(f"{BASE_URL}/reviews/sentiment-stats")
-        print(f"GET /reviews/sentiment-stats - Status: {response.status_code}")
-        stats = response.json()
+        with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+            responses = list(executor.map(_session.get, urls))
+
+        print(f"GET /reviews/sentiment-stats - Status: {responses[0].status_code}")
+        stats = responses[0].json()
         print(f"Total stats: {stats.get('data', {})}")
-        
-        # 특정 회사 감정 통계
+
         if company_id:
-            response = requests.get(f"{BASE_URL}/reviews/sentiment-stats?company_id={company_id}")
-            print(f"GET /reviews/sentiment-stats?company_id={company_id} - Status: {response.status_code}")
-            company_stats = response.json()
+            print(f"GET /reviews/sentiment-stats?company_id={company_id} - Status: {responses[1].status_code}")
+            company_stats = responses[1].json()
             print(f"Company stats: {company_stats.get('data', {})}")
-        
+
     except Exception as e:
         print(f"Error: {e}")
 
@@ -93,7 +112,7 @@ def test_departments():
     print("\n=== 부서 API 테스트 ===")
     
     try:
-        response = requests.get(f"{BASE_URL}/departments")
+        response = _session.get(f"{BASE_URL}/departments")
         print(f"GET /departments - Status: {response.status_code}")
         departments = response.json()
         print(f"Departments count: {len(departments.get('data', []))}")
@@ -110,16 +129,21 @@ def test_search():
     print("\n=== 검색 API 테스트 ===")
     
     search_queries = ["앱", "로그인", "고객센터"]
-    
-    for query in search_queries:
-        try:
-            response = requests.get(f"{BASE_URL}/reviews/search?q={query}")
-            print(f"GET /reviews/search?q={query} - Status: {response.status_code}")
-            results = response.json()
-            print(f"Search results for '{query}': {len(results.get('data', []))}")
-            
-        except Exception as e:
-            print(f"Error searching for '{query}': {e}")
+
+    try:
+        # 여러 검색어를 한 번의 요청으로 일괄 검색 (서버가 msearch로 처리)
+        response = _session.get(
+            f"{BASE_URL}/reviews/search",
+            params=[("q", query) for query in search_queries]
+        )
+        print(f"GET /reviews/search (batch) - Status: {response.status_code}")
+        results = response.json()
+
+        for query, hits in results.get('data', {}).items():
+            print(f"Search results for '{query}': {len(hits)}")
+
+    except Exception as e:
+        print(f"Error searching for {search_queries}: {e}")
 
 
 def main():
@@ -1,14 +1,88 @@
 """
 AutoGen 멀티 에이전트 서비스
 """
+import functools
 import logging
+import uuid
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 import json
 from config.settings import settings
+from database.redis_client import redis_manager
 
 logger = logging.getLogger(__name__)
 
+# 분석 작업 결과 보존 시간 (초)
+JOB_RESULT_TTL_SECONDS = 3600
+
+# 재사용하는 JSON 디코더 (raw_decode로 부분 문자열 파싱)
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _extract_last_json(content: str) -> Optional[Dict[str, Any]]:
+    """문자열에서 마지막 균형 잡힌 {...} 블록을 찾아 파싱
+
+    중괄호 깊이를 추적하며 한 번만 순회해 후보 시작 위치들을 모으고,
+    뒤에서부터 raw_decode를 시도한다. find/rfind로 전체를 썰어보는
+    방식과 달리 O(n)이며, 중첩/복수 JSON 블록에도 안전하다.
+    """
+    if not content:
+        return None
+
+    candidates = []
+    depth = 0
+    start = 0
+    in_string = False
+    escaped = False
+
+    for i, ch in enumerate(content):
+        # 문자열 리터럴 내부의 중괄호는 깊이에 반영하지 않는다
+        # (값에 코드/템플릿이 인용된 JSON도 균형이 깨지지 않도록)
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+            continue
+
+        if ch == '"':
+            if depth > 0:
+                in_string = True
+        elif ch == '{':
+            if depth == 0:
+                start = i
+            depth += 1
+        elif ch == '}' and depth > 0:
+            depth -= 1
+            if depth == 0:
+                candidates.append(start)
+
+    for candidate in reversed(candidates):
+        try:
+            value, _ = _JSON_DECODER.raw_decode(content, candidate)
+            if isinstance(value, dict):
+                return value
+        except json.JSONDecodeError:
+            continue
+
+    # 균형 잡힌 후보가 하나도 파싱되지 않으면 (프로즈 속 따옴표 등으로
+    # 상태 추적이 어긋난 경우) 모든 '{' 위치에서 뒤에서부터 직접 시도
+    for i in range(len(content) - 1, -1, -1):
+        if content[i] != '{':
+            continue
+        try:
+            value, _ = _JSON_DECODER.raw_decode(content, i)
+            if isinstance(value, dict):
+                return value
+        except json.JSONDecodeError:
+            continue
+
+    return None
+
 try:
     import autogen
     AUTOGEN_AVAILABLE = True
@@ -16,6 +90,63 @@ except ImportError:
     AUTOGEN_AVAILABLE = False
     logger.warning("AutoGen 패키지가 설치되지 않았습니다. 멀티 에이전트 기능이 비활성화됩니다.")
 
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+    logger.warning("tiktoken 패키지가 없어 문자 수 기반 토큰 추정을 사용합니다.")
+
+# 리뷰 프롬프트에 허용하는 입력 토큰 예산 (컨텍스트 한도 - 출력 여유분)
+REVIEW_PROMPT_TOKEN_BUDGET = 6000
+
+# 리뷰 요약 템플릿 (호출마다 f-string 재조립 대신 format_map 1회)
+_REVIEW_SUMMARY_TEMPLATE = (
+    "리뷰 ID: {id}\n"
+    "평점: {rating}/5\n"
+    "플랫폼: {platform}\n"
+    "감정: {sentiment}\n"
+    "내용: {content}..."
+)
+
+_REVIEW_SUMMARY_DEFAULTS = {
+    "id": "N/A",
+    "rating": "N/A",
+    "platform": "N/A",
+    "sentiment": "N/A",
+    "content": ""
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _get_encoder():
+    """설정된 모델의 tiktoken 인코더
+
+    미등록 모델은 cl100k_base로 폴백하고, BPE 테이블 다운로드 실패 등
+    어떤 이유로든 인코더를 못 만들면 None을 반환한다 (문자 수 추정 사용).
+    """
+    try:
+        return tiktoken.encoding_for_model(settings.OPENAI_MODEL)
+    except KeyError:
+        try:
+            return tiktoken.get_encoding("cl100k_base")
+        except Exception as e:
+            logger.warning(f"tiktoken 인코더 로드 실패, 문자 수 추정 사용: {e}")
+            return None
+    except Exception as e:
+        logger.warning(f"tiktoken 인코더 로드 실패, 문자 수 추정 사용: {e}")
+        return None
+
+
+def _count_tokens(text: str) -> int:
+    """토큰 수 계산 (인코더 미가용 시 한국어 기준 보수적 추정)"""
+    if TIKTOKEN_AVAILABLE:
+        encoder = _get_encoder()
+        if encoder is not None:
+            return len(encoder.encode(text))
+    # 한국어/JSON 혼합 텍스트는 대략 1토큰당 1~2자
+    return max(1, len(text))
+
 
 class AutoGenService:
     """AutoGen 멀티 에이전트 서비스"""
@@ -24,7 +155,16 @@ class AutoGenService:
         self.enabled = settings.AUTOGEN_ENABLED and AUTOGEN_AVAILABLE
         self.agents = {}
         self.group_chats = {}
-        
+        self._llm_config = None
+        # 장시간 분석을 요청 스레드 밖에서 수행하는 작업 실행기
+        self._job_executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="autogen-job"
+        )
+        # 독립적인 그룹 채팅(finance/tech)을 동시에 돌리는 실행기
+        self._chat_executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="autogen-chat"
+        )
+
         if self.enabled:
             self._initialize_agents()
     
@@ -92,19 +232,59 @@ class AutoGenService:
             
             # 그룹 채팅 설정
             self._setup_group_chats()
-            
+
+            # 라운드 간 히스토리 재전송량 상한 적용
+            self._apply_history_limits()
+
             logger.info("AutoGen 에이전트 초기화 완료")
             
         except Exception as e:
             logger.error(f"AutoGen 에이전트 초기화 오류: {e}")
             self.enabled = False
     
+    def _apply_history_limits(self):
+        """어시스턴트 에이전트의 재전송 히스토리를 상수로 캡
+
+        GroupChat은 라운드마다 누적 히스토리 전체를 다시 보내 토큰 비용이
+        O(라운드²)로 커진다. 최근 메시지 수/토큰 수 제한 변환을 달아
+        라운드당 컨텍스트를 상수로 고정한다. 변환 기능이 없는 AutoGen
+        버전에서는 조용히 건너뛴다.
+        """
+        try:
+            from autogen.agentchat.contrib.capabilities.transform_messages import TransformMessages
+            from autogen.agentchat.contrib.capabilities.transforms import (
+                MessageHistoryLimiter,
+                MessageTokenLimiter,
+            )
+        except ImportError:
+            logger.warning("AutoGen 메시지 변환 기능 미지원 버전, 히스토리 제한 생략")
+            return
+
+        try:
+            for name in ('financial_analyst', 'customer_service', 'tech_analyst'):
+                TransformMessages(transforms=[
+                    MessageHistoryLimiter(
+                        max_messages=settings.AUTOGEN_HISTORY_MAX_MESSAGES
+                    ),
+                    MessageTokenLimiter(
+                        max_tokens=settings.AUTOGEN_HISTORY_MAX_TOKENS,
+                        model=settings.OPENAI_MODEL
+                    ),
+                ]).add_to_agent(self.agents[name])
+        except Exception as e:
+            logger.error(f"히스토리 제한 적용 오류: {e}")
+
     def _get_llm_config(self) -> Dict[str, Any]:
-        """LLM 설정 반환"""
+        """LLM 설정 반환 (설정은 프로세스 내 불변이므로 1회만 조립 후 재사용)"""
+        if self._llm_config is not None:
+            return self._llm_config
+
         config = {
             "timeout": settings.LLM_TIMEOUT,
             "temperature": settings.LLM_TEMPERATURE,
             "max_tokens": settings.LLM_MAX_TOKENS,
+            # 동일 시드로 AutoGen 내장 디스크 캐시를 활성화해 반복 분석 재사용
+            "cache_seed": settings.AUTOGEN_CACHE_SEED if settings.AUTOGEN_CACHE else None,
         }
         
         if settings.LLM_PROVIDER == "openai" and settings.OPENAI_API_KEY:
@@ -122,7 +302,8 @@ class AutoGenService:
                     "api_type": "google"
                 }]
             })
-        
+
+        self._llm_config = config
         return config
     
     def _setup_group_chats(self):
@@ -141,7 +322,9 @@ class AutoGenService:
             self.group_chats['finance'] = autogen.GroupChat(
                 agents=finance_agents,
                 messages=[],
-                max_round=settings.AUTOGEN_MAX_ROUND
+                max_round=settings.AUTOGEN_MAX_ROUND,
+                # 발언자 선택에 LLM 호출을 쓰지 않도록 라운드로빈 고정
+                speaker_selection_method="round_robin"
             )
             
             # 기술 분석 그룹
@@ -154,7 +337,8 @@ class AutoGenService:
             self.group_chats['tech'] = autogen.GroupChat(
                 agents=tech_agents,
                 messages=[],
-                max_round=settings.AUTOGEN_MAX_ROUND
+                max_round=settings.AUTOGEN_MAX_ROUND,
+                speaker_selection_method="round_robin"
             )
             
         except Exception as e:
@@ -165,11 +349,35 @@ class AutoGenService:
         """리뷰 분석 수행"""
         if not self.enabled:
             return {"error": "AutoGen이 비활성화되어 있습니다"}
-        
+
+        # comprehensive는 finance/tech 두 그룹을 병렬 실행해 결과를 묶는다
+        if analysis_type == "comprehensive":
+            multi_results = self.analyze_reviews_multi(
+                reviews, ["financial", "technical"]
+            )
+
+            errors = {
+                sub_type: sub_result["error"]
+                for sub_type, sub_result in multi_results.items()
+                if "error" in sub_result
+            }
+            if len(errors) == len(multi_results):
+                return {"error": "; ".join(errors.values())}
+
+            return {
+                "success": True,
+                "analysis_type": "comprehensive",
+                "result": {
+                    sub_type: sub_result.get("result", {"error": errors.get(sub_type)})
+                    for sub_type, sub_result in multi_results.items()
+                },
+                "timestamp": datetime.utcnow().isoformat()
+            }
+
         try:
             # 리뷰 데이터 준비
             review_text = self._prepare_review_data(reviews)
-            
+
             # 분석 유형에 따른 그룹 선택
             if analysis_type == "financial":
                 group_chat = self.group_chats.get('finance')
@@ -177,7 +385,7 @@ class AutoGenService:
                 group_chat = self.group_chats.get('tech')
             else:
                 group_chat = self.group_chats.get('finance')  # 기본값
-            
+
             if not group_chat:
                 return {"error": "적절한 분석 그룹을 찾을 수 없습니다"}
             
@@ -223,20 +431,117 @@ class AutoGenService:
             logger.error(f"리뷰 분석 오류: {e}")
             return {"error": str(e)}
     
+    def analyze_reviews_multi(self, reviews: List[Dict[str, Any]],
+                              analysis_types: List[str]) -> Dict[str, Dict[str, Any]]:
+        """여러 분석 유형을 동시에 수행
+
+        finance/tech 그룹 채팅은 서로 독립적이므로 순차 실행의
+        sum(t_i) 대신 max(t_i)에 전체가 끝난다. 분석 유형별 결과를
+        딕셔너리로 반환한다.
+        """
+        if not self.enabled:
+            return {"error": "AutoGen이 비활성화되어 있습니다"}
+
+        if not analysis_types:
+            return {}
+
+        # 중복 유형 제거 후 병렬 제출
+        futures = {
+            analysis_type: self._chat_executor.submit(
+                self.analyze_reviews, reviews, analysis_type
+            )
+            for analysis_type in dict.fromkeys(analysis_types)
+        }
+
+        results = {}
+        for analysis_type, future in futures.items():
+            try:
+                results[analysis_type] = future.result(timeout=settings.AUTOGEN_TIMEOUT)
+            except Exception as e:
+                logger.error(f"병렬 분석 실패 [{analysis_type}]: {e}")
+                results[analysis_type] = {"error": str(e)}
+
+        return results
+
+    def submit_analysis(self, reviews: List[Dict[str, Any]],
+                        analysis_type: str = "comprehensive") -> str:
+        """리뷰 분석을 백그라운드 작업으로 제출하고 작업 ID 반환"""
+        job_id = uuid.uuid4().hex
+
+        self._store_job(job_id, {
+            "status": "pending",
+            "analysis_type": analysis_type,
+            "review_count": len(reviews),
+            "submitted_at": datetime.utcnow().isoformat()
+        })
+
+        self._job_executor.submit(self._run_analysis_job, job_id, reviews, analysis_type)
+
+        logger.info(f"분석 작업 제출: {job_id} (리뷰 {len(reviews)}개)")
+        return job_id
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """분석 작업 상태/결과 조회"""
+        return redis_manager.get(f"autogen:job:{job_id}")
+
+    def _run_analysis_job(self, job_id: str, reviews: List[Dict[str, Any]],
+                          analysis_type: str):
+        """백그라운드 분석 작업 실행"""
+        try:
+            result = self.analyze_reviews(reviews, analysis_type)
+            self._store_job(job_id, {
+                "status": "failed" if "error" in result else "finished",
+                "analysis_type": analysis_type,
+                "result": result,
+                "finished_at": datetime.utcnow().isoformat()
+            })
+        except Exception as e:
+            logger.error(f"분석 작업 실패 [{job_id}]: {e}")
+            self._store_job(job_id, {
+                "status": "failed",
+                "analysis_type": analysis_type,
+                "error": str(e),
+                "finished_at": datetime.utcnow().isoformat()
+            })
+
+    def _store_job(self, job_id: str, payload: Dict[str, Any]):
+        """작업 상태 저장
+
+        작업 레코드는 캐시가 아니라 상태 조회의 시스템 오브 레코드이므로
+        write-behind 큐를 거치지 않고 동기 저장한다 (202 응답 직후 폴링이
+        플러시 워커와 경합해 404가 나는 것을 방지).
+        """
+        redis_manager.set_sync(f"autogen:job:{job_id}", payload, JOB_RESULT_TTL_SECONDS)
+
     def _prepare_review_data(self, reviews: List[Dict[str, Any]]) -> str:
-        """리뷰 데이터 준비"""
+        """리뷰 데이터 준비
+
+        고정 개수 슬라이스 대신 실제 토큰 수를 세며 예산
+        (REVIEW_PROMPT_TOKEN_BUDGET)까지 리뷰를 채운다. 컨텍스트 초과로
+        인한 400 재시도를 피하면서 짧은 리뷰가 많을 때는 더 많이 싣는다.
+        """
         review_summaries = []
-        
-        for review in reviews[:20]:  # 최대 20개 리뷰만 처리
-            summary = f"""
-            리뷰 ID: {review.get('id', 'N/A')}
-            평점: {review.get('rating', 'N/A')}/5
-            플랫폼: {review.get('platform', 'N/A')}
-            감정: {review.get('sentiment', 'N/A')}
-            내용: {review.get('content', '')[:200]}...
-            """
-            review_summaries.append(summary.strip())
-        
+        used_tokens = 0
+
+        for review in reviews:
+            content = review.get('content', '')
+            if len(content) > 200:
+                content = content[:200]
+
+            summary = _REVIEW_SUMMARY_TEMPLATE.format_map(
+                ChainMap({"content": content}, review, _REVIEW_SUMMARY_DEFAULTS)
+            )
+
+            summary_tokens = _count_tokens(summary)
+            if used_tokens + summary_tokens > REVIEW_PROMPT_TOKEN_BUDGET:
+                logger.info(
+                    f"토큰 예산 도달: 리뷰 {len(review_summaries)}/{len(reviews)}개 포함"
+                )
+                break
+
+            review_summaries.append(summary)
+            used_tokens += summary_tokens
+
         return "\n\n".join(review_summaries)
     
     def _process_chat_result(self, chat_result) -> Dict[str, Any]:
@@ -248,18 +553,11 @@ class AutoGenService:
             else:
                 messages = []
             
-            # JSON 형태의 응답 찾기
+            # JSON 형태의 응답 찾기 (최신 메시지부터, 첫 유효 파싱에서 반환)
             for message in reversed(messages):
-                content = message.get('content', '')
-                if '{' in content and '}' in content:
-                    try:
-                        # JSON 부분 추출 시도
-                        start = content.find('{')
-                        end = content.rfind('}') + 1
-                        json_str = content[start:end]
-                        return json.loads(json_str)
-                    except json.JSONDecodeError:
-                        continue
+                parsed = _extract_last_json(message.get('content', ''))
+                if parsed is not None:
+                    return parsed
             
             # JSON을 찾지 못한 경우 텍스트 응답 반환
             return {
@@ -288,5 +586,7 @@ class AutoGenService:
         }
 
 
-# 전역 AutoGen 서비스 인스턴스
-autogen_service = AutoGenService()
\ No newline at end of file
+@functools.lru_cache(maxsize=1)
+def get_autogen_service() -> AutoGenService:
+    """AutoGen 서비스 지연 싱글턴 (최초 호출 시 에이전트 구성)"""
+    return AutoGenService()
\ No newline at end of file
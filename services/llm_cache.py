@@ -0,0 +1,73 @@
+"""
+LLM 응답 캐시 (결정적 호출 전용)
+"""
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+import orjson
+from config.settings import settings
+from database.redis_client import redis_manager
+
+logger = logging.getLogger(__name__)
+
+# Redis 미가용 시 폴백하는 프로세스 내 LRU 최대 항목 수
+MEMORY_CACHE_MAXSIZE = 1024
+
+
+class LLMCache:
+    """temperature=0 LLM 호출의 응답 캐시
+
+    temperature가 0이면 동일한 (모델, 메시지) 조합은 항상 같은 응답을
+    내므로 반복 호출을 API까지 보내지 않는다. Redis를 우선 사용하고,
+    Redis가 내려간 경우 프로세스 내 LRU 딕셔너리로 폴백한다.
+    값은 {"v": 응답} 형태로 감싸 저장해 응답 문자열이 JSON처럼 보여도
+    타입이 바뀌지 않게 한다.
+    """
+
+    def __init__(self):
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0}
+
+    @staticmethod
+    def make_key(model: str, messages: List[Any], temperature: float) -> str:
+        """모델+메시지+temperature의 sha256으로 캐시 키 생성"""
+        payload = orjson.dumps(
+            {"model": model, "messages": messages, "temp": temperature},
+            option=orjson.OPT_SORT_KEYS
+        )
+        return f"llm_cache:{hashlib.sha256(payload).hexdigest()}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시 조회 (hit/miss 통계 갱신)"""
+        value = redis_manager.get(key)
+
+        if not isinstance(value, dict):
+            with self._lock:
+                value = self._memory.get(key)
+                if value is not None:
+                    self._memory.move_to_end(key)
+
+        if isinstance(value, dict) and "v" in value:
+            self.stats["hits"] += 1
+            return value
+
+        self.stats["misses"] += 1
+        return None
+
+    def set(self, key: str, response: Any, ttl: Optional[int] = None):
+        """캐시 저장 (Redis + 인메모리 LRU 동시 기록)"""
+        value = {"v": response}
+        redis_manager.set(key, value, ttl or settings.CACHE_TTL_SECONDS)
+
+        with self._lock:
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+            while len(self._memory) > MEMORY_CACHE_MAXSIZE:
+                self._memory.popitem(last=False)
+
+
+# 전역 LLM 캐시 인스턴스
+llm_cache = LLMCache()
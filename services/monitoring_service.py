@@ -1,8 +1,14 @@
 """
 모니터링 및 추적 서비스 (Langfuse, Phoenix)
 """
+import atexit
+import functools
 import logging
+import queue
+import random
+import threading
 from typing import Dict, Any, Optional
+from urllib.parse import urlparse
 from datetime import datetime
 from config.settings import settings
 
@@ -31,15 +37,54 @@ if settings.PHOENIX_ENABLED:
 class MonitoringService:
     """모니터링 및 추적 서비스"""
     
+    # 추적 큐 용량 (포화 시 추적을 버리고 카운터만 증가)
+    TRACE_QUEUE_MAXSIZE = 1000
+
     def __init__(self):
         self.langfuse_client = None
         self.phoenix_client = None
-        
+        self.dropped_traces = 0
+
         if settings.LANGFUSE_ENABLED and LANGFUSE_AVAILABLE:
             self._initialize_langfuse()
-        
+
         if settings.PHOENIX_ENABLED and PHOENIX_AVAILABLE:
             self._initialize_phoenix()
+
+        # 추적 기록은 핫 패스 밖의 전용 스레드가 처리 (fire-and-forget)
+        self._trace_queue = queue.Queue(maxsize=self.TRACE_QUEUE_MAXSIZE)
+        self._trace_worker = threading.Thread(
+            target=self._drain_traces,
+            name="monitoring-trace",
+            daemon=True
+        )
+        self._trace_worker.start()
+
+    def _enqueue_trace(self, kind: str, payload: Dict[str, Any]):
+        """추적 이벤트를 큐에 제출 (샘플링 탈락/큐 포화 시 버림)"""
+        if settings.MONITORING_SAMPLE_RATE < 1.0 and \
+                random.random() >= settings.MONITORING_SAMPLE_RATE:
+            return
+
+        try:
+            self._trace_queue.put_nowait((kind, payload))
+        except queue.Full:
+            self.dropped_traces += 1
+
+    def _drain_traces(self):
+        """큐에 쌓인 추적 이벤트를 순서대로 기록하는 워커"""
+        while True:
+            kind, payload = self._trace_queue.get()
+            try:
+                getattr(self, f"_emit_{kind}")(**payload)
+
+                # 버스트가 끝나 큐가 비면 한 번에 플러시
+                if self._trace_queue.empty() and self.langfuse_client:
+                    self.langfuse_client.flush()
+            except Exception as e:
+                logger.error(f"추적 이벤트 기록 오류 [{kind}]: {e}")
+            finally:
+                self._trace_queue.task_done()
     
     def _initialize_langfuse(self):
         """Langfuse 초기화"""
@@ -68,10 +113,17 @@ class MonitoringService:
         """Phoenix 초기화"""
         try:
             if settings.PHOENIX_ENDPOINT:
-                # Phoenix 세션 시작
+                # 수동 split 대신 urlparse로 한 번에 검증하며 파싱
+                parsed = urlparse(settings.PHOENIX_ENDPOINT)
+                if parsed.hostname is None:
+                    raise ValueError(
+                        f"잘못된 PHOENIX_ENDPOINT 형식: {settings.PHOENIX_ENDPOINT}"
+                    )
+
+                # Phoenix 세션 시작 (포트 생략 시 Phoenix 기본 포트)
                 px.launch_app(
-                    host=settings.PHOENIX_ENDPOINT.split('://')[1].split(':')[0],
-                    port=int(settings.PHOENIX_ENDPOINT.split(':')[-1])
+                    host=parsed.hostname,
+                    port=parsed.port or 6006
                 )
             
             logger.info("Phoenix 클라이언트 초기화 완료")
@@ -80,14 +132,26 @@ class MonitoringService:
             logger.error(f"Phoenix 초기화 오류: {e}")
             self.phoenix_client = None
     
-    def trace_llm_call(self, 
+    def trace_llm_call(self,
                       model: str,
                       input_text: str,
                       output_text: str,
-                      metadata: Optional[Dict[str, Any]] = None) -> Optional[str]:
-        """LLM 호출 추적"""
-        trace_id = None
-        
+                      metadata: Optional[Dict[str, Any]] = None):
+        """LLM 호출 추적 (큐 제출 후 즉시 반환)"""
+        if self.langfuse_client and settings.LANGFUSE_TRACE_LLM:
+            self._enqueue_trace("llm_call", {
+                "model": model,
+                "input_text": input_text,
+                "output_text": output_text,
+                "metadata": metadata
+            })
+
+    def _emit_llm_call(self,
+                       model: str,
+                       input_text: str,
+                       output_text: str,
+                       metadata: Optional[Dict[str, Any]] = None):
+        """LLM 호출 추적 기록 (워커 스레드 전용)"""
         # Langfuse 추적
         if self.langfuse_client and settings.LANGFUSE_TRACE_LLM:
             try:
@@ -104,23 +168,34 @@ class MonitoringService:
                     metadata=metadata or {}
                 )
                 
-                trace_id = trace.id
-                logger.debug(f"Langfuse LLM 추적 완료: {trace_id}")
-                
+                logger.debug(f"Langfuse LLM 추적 완료: {trace.id}")
+
             except Exception as e:
                 logger.error(f"Langfuse LLM 추적 오류: {e}")
-        
-        return trace_id
-    
+
     def trace_agent_action(self,
                           agent_name: str,
                           action: str,
                           input_data: Dict[str, Any],
                           output_data: Dict[str, Any],
-                          metadata: Optional[Dict[str, Any]] = None) -> Optional[str]:
-        """에이전트 액션 추적"""
-        trace_id = None
-        
+                          metadata: Optional[Dict[str, Any]] = None):
+        """에이전트 액션 추적 (큐 제출 후 즉시 반환)"""
+        if self.langfuse_client and settings.LANGFUSE_TRACE_AGENTS:
+            self._enqueue_trace("agent_action", {
+                "agent_name": agent_name,
+                "action": action,
+                "input_data": input_data,
+                "output_data": output_data,
+                "metadata": metadata
+            })
+
+    def _emit_agent_action(self,
+                           agent_name: str,
+                           action: str,
+                           input_data: Dict[str, Any],
+                           output_data: Dict[str, Any],
+                           metadata: Optional[Dict[str, Any]] = None):
+        """에이전트 액션 추적 기록 (워커 스레드 전용)"""
         # Langfuse 추적
         if self.langfuse_client and settings.LANGFUSE_TRACE_AGENTS:
             try:
@@ -140,55 +215,79 @@ class MonitoringService:
                     metadata=metadata or {}
                 )
                 
-                trace_id = trace.id
-                logger.debug(f"Langfuse 에이전트 추적 완료: {trace_id}")
-                
+                logger.debug(f"Langfuse 에이전트 추적 완료: {trace.id}")
+
             except Exception as e:
                 logger.error(f"Langfuse 에이전트 추적 오류: {e}")
-        
-        return trace_id
-    
+
     def trace_autogen_conversation(self,
                                  conversation_id: str,
                                  messages: list,
-                                 metadata: Optional[Dict[str, Any]] = None) -> Optional[str]:
-        """AutoGen 대화 추적"""
-        trace_id = None
-        
+                                 metadata: Optional[Dict[str, Any]] = None):
+        """AutoGen 대화 추적 (큐 제출 후 즉시 반환)"""
+        if self.langfuse_client and settings.LANGFUSE_TRACE_AUTOGEN:
+            self._enqueue_trace("autogen_conversation", {
+                "conversation_id": conversation_id,
+                "messages": messages,
+                "metadata": metadata
+            })
+
+    def _emit_autogen_conversation(self,
+                                   conversation_id: str,
+                                   messages: list,
+                                   metadata: Optional[Dict[str, Any]] = None):
+        """AutoGen 대화 추적 기록 (워커 스레드 전용)"""
         # Langfuse 추적
         if self.langfuse_client and settings.LANGFUSE_TRACE_AUTOGEN:
             try:
+                # 메시지당 span 생성(N회 클라이언트 호출) 대신 전체 대화를
+                # 하나의 trace 페이로드로 1회 제출
                 trace = self.langfuse_client.trace(
                     name="autogen_conversation",
+                    input={
+                        "messages": [
+                            {
+                                "role": message.get("role", "unknown"),
+                                "content": message.get("content", "")
+                            }
+                            for message in messages
+                        ]
+                    },
                     metadata={
                         "conversation_id": conversation_id,
                         "message_count": len(messages),
                         **(metadata or {})
                     }
                 )
-                
-                for i, message in enumerate(messages):
-                    trace.span(
-                        name=f"message_{i}",
-                        input={"role": message.get("role", "unknown")},
-                        output={"content": message.get("content", "")},
-                        metadata={"message_index": i}
-                    )
-                
-                trace_id = trace.id
-                logger.debug(f"Langfuse AutoGen 추적 완료: {trace_id}")
-                
+
+                logger.debug(f"Langfuse AutoGen 추적 완료: {trace.id}")
+
             except Exception as e:
                 logger.error(f"Langfuse AutoGen 추적 오류: {e}")
-        
-        return trace_id
-    
+
     def log_performance_metrics(self,
                               operation: str,
                               duration: float,
                               success: bool,
                               metadata: Optional[Dict[str, Any]] = None):
-        """성능 메트릭 로깅"""
+        """성능 메트릭 로깅 (큐 제출 후 즉시 반환)"""
+        # 로그 출력은 호출 지점에서 바로 남긴다
+        logger.info(f"성능 메트릭: {operation} - {duration:.3f}s - {'성공' if success else '실패'}")
+
+        if self.langfuse_client:
+            self._enqueue_trace("performance_metric", {
+                "operation": operation,
+                "duration": duration,
+                "success": success,
+                "metadata": metadata
+            })
+
+    def _emit_performance_metric(self,
+                                 operation: str,
+                                 duration: float,
+                                 success: bool,
+                                 metadata: Optional[Dict[str, Any]] = None):
+        """성능 메트릭 기록 (워커 스레드 전용)"""
         try:
             metrics = {
                 "operation": operation,
@@ -197,23 +296,28 @@ class MonitoringService:
                 "timestamp": datetime.utcnow().isoformat(),
                 **(metadata or {})
             }
-            
+
             # Langfuse 메트릭
             if self.langfuse_client:
                 self.langfuse_client.trace(
                     name="performance_metric",
                     metadata=metrics
                 )
-            
-            # 로그 출력
-            logger.info(f"성능 메트릭: {operation} - {duration:.3f}s - {'성공' if success else '실패'}")
-            
+
         except Exception as e:
             logger.error(f"성능 메트릭 로깅 오류: {e}")
     
     def get_monitoring_status(self) -> Dict[str, Any]:
         """모니터링 상태 조회"""
+        from services.llm_cache import llm_cache
+
         return {
+            "llm_cache": dict(llm_cache.stats),
+            "trace_queue": {
+                "pending": self._trace_queue.qsize(),
+                "dropped": self.dropped_traces,
+                "sample_rate": settings.MONITORING_SAMPLE_RATE
+            },
             "langfuse": {
                 "enabled": settings.LANGFUSE_ENABLED,
                 "available": LANGFUSE_AVAILABLE,
@@ -249,5 +353,10 @@ class MonitoringService:
             logger.error(f"추적 데이터 플러시 오류: {e}")
 
 
-# 전역 모니터링 서비스 인스턴스
-monitoring_service = MonitoringService()
\ No newline at end of file
+@functools.lru_cache(maxsize=1)
+def get_monitoring_service() -> MonitoringService:
+    """모니터링 서비스 지연 싱글턴 (최초 호출 시 클라이언트 연결)"""
+    service = MonitoringService()
+    # 프로세스 종료 시 큐에 남은 추적 데이터 유실 방지
+    atexit.register(service.flush_traces)
+    return service
\ No newline at end of file
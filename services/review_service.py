@@ -1,24 +1,98 @@
 """
 리뷰 분석 서비스
 """
+import atexit
 import logging
-from typing import List, Dict, Any, Optional
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Dict, Any, Optional
 from datetime import datetime
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 from models.database import Review, FinancialCompany, Department, AgentLog, SentimentEnum, PlatformEnum
 from database.connection import db_manager
 from database.redis_client import redis_manager
 from database.opensearch_client import opensearch_manager
-from services.llm_service import llm_service
+from services.llm_service import get_llm_service
+from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
 
+# Enum __call__은 호출마다 멤버 탐색을 수행하므로 요청 경로에서는
+# 사전 계산된 값→멤버 매핑으로 조회한다 (잘못된 값은 KeyError)
+_PLATFORM_MAP = {member.value: member for member in PlatformEnum}
+_SENTIMENT_MAP = {member.value: member for member in SentimentEnum}
+
+
 class ReviewService:
     """리뷰 분석 서비스"""
     
+    # 인덱싱 대기열 용량 (포화 시 동기 인덱싱으로 폴백)
+    INDEX_QUEUE_MAXSIZE = 10000
+
+    # 세대 번호의 프로세스 내 메모 유지 시간 (읽기마다의 Redis GET 제거;
+    # 다른 프로세스의 무효화가 보이기까지의 지연 상한이기도 함)
+    REV_MEMO_TTL_SECONDS = 0.3
+
     def __init__(self):
         self.cache_prefix = "review_service"
+
+        # OpenSearch 인덱싱은 리뷰 생성 경로에서 떼어내 백그라운드 스레드가
+        # 배치(bulk)로 수행 - 문서당 1회 왕복 대신 배치당 1회 왕복
+        self._index_queue = queue.Queue(maxsize=self.INDEX_QUEUE_MAXSIZE)
+        self._index_worker = threading.Thread(
+            target=self._drain_index_queue,
+            name="opensearch-indexer",
+            daemon=True
+        )
+        self._index_worker.start()
+
+        # create_review의 감정 분석/부서 배정 LLM 호출을 겹치기 위한 풀
+        self._llm_executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="review-llm"
+        )
+
+        # 부서 목록은 거의 변하지 않으므로 프로세스 내 TTL 캐시로 리뷰
+        # 생성마다의 SELECT를 제거 (만료 시각, 직렬화된 dict 목록)
+        self._dept_cache: Optional[tuple] = None
+        self._dept_cache_lock = threading.Lock()
+
+        # 캐시 세대 번호의 단기 메모 (만료 시각, 세대 번호)
+        self._rev_memo: Optional[tuple] = None
+        self._rev_memo_lock = threading.Lock()
+
+        # 커밋 후 부수 작업(캐시 무효화 등)을 요청 스레드에서 떼어내는 풀
+        self._bg_executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="review-bg"
+        )
+        atexit.register(self._bg_executor.shutdown)
+
+    def _current_rev(self) -> int:
+        """현재 캐시 세대 번호 조회
+
+        캐시 키에 세대 번호를 심어 두면 무효화는 INCR 한 번으로 끝나고
+        (키 공간 크기와 무관한 O(1)), 이전 세대 키는 TTL로 자연 소멸한다.
+        최초 시드는 밀리초 타임스탬프라 재배포 후에도 과거 세대와 겹치지 않는다.
+        REV_MEMO_TTL_SECONDS 동안 프로세스 내에 메모해 읽기 경로가 매번
+        Redis 왕복을 치르지 않도록 한다.
+        """
+        now = time.monotonic()
+
+        with self._rev_memo_lock:
+            if self._rev_memo is not None and self._rev_memo[0] > now:
+                return self._rev_memo[1]
+
+        rev = redis_manager.get_or_init(
+            f"{self.cache_prefix}:rev", int(time.time() * 1000)
+        )
+
+        with self._rev_memo_lock:
+            self._rev_memo = (now + self.REV_MEMO_TTL_SECONDS, rev)
+
+        return rev
     
     def create_review(self, review_data: Dict[str, Any]) -> Optional[Review]:
         """리뷰 생성"""
@@ -39,146 +113,387 @@ class ReviewService:
                     content=review_data['content'],
                     rating=review_data.get('rating'),
                     review_date=review_data.get('review_date'),
-                    platform=PlatformEnum(review_data['platform'])
+                    platform=_PLATFORM_MAP[review_data['platform']].value
                 )
                 
                 session.add(review)
                 session.flush()  # ID 생성을 위해 flush
                 
                 # 감정 분석 수행
-                if llm_service.is_available():
-                    sentiment_result = llm_service.analyze_sentiment(review.content)
-                    review.sentiment = SentimentEnum(sentiment_result['sentiment'])
-                    review.sentiment_score = sentiment_result['score']
-                    
-                    # 부서 배정
-                    departments = self.get_departments(session)
-                    if departments:
-                        assigned_dept = llm_service.assign_department(
-                            review.content, 
-                            [dept.to_dict() for dept in departments]
+                llm = get_llm_service()
+                if llm.is_available():
+                    dept_dicts = self._get_department_dicts(session)
+
+                    # 감정 분석과 부서 배정은 서로 독립적인 LLM 호출이므로
+                    # 병렬로 실행 (대기 시간이 두 호출의 합 → 최대값)
+                    sentiment_future = self._llm_executor.submit(
+                        llm.analyze_sentiment, review.content
+                    )
+                    dept_future = None
+                    if dept_dicts:
+                        dept_future = self._llm_executor.submit(
+                            llm.assign_department, review.content, dept_dicts
                         )
+
+                    sentiment_result = sentiment_future.result()
+                    review.sentiment = _SENTIMENT_MAP[sentiment_result['sentiment']].value
+                    review.sentiment_score = sentiment_result['score']
+
+                    if dept_future is not None:
+                        assigned_dept = dept_future.result()
                         if assigned_dept:
                             review.department_assigned = assigned_dept
                 
                 review.processed = True
                 session.commit()
                 
-                # OpenSearch에 인덱싱
+                # OpenSearch 인덱싱(대기열 등록)과 캐시 무효화는 응답을
+                # 막지 않도록 커밋 후 백그라운드로 수행
                 self._index_review_to_opensearch(review)
-                
-                # 캐시 무효화
-                self._invalidate_cache()
-                
-                logger.info(f"리뷰 생성 완료: {review.id}")
+                self._bg_executor.submit(self._invalidate_cache)
+
+                logger.info("리뷰 생성 완료: %s", review.id)
                 return review
                 
         except Exception as e:
             logger.error(f"리뷰 생성 오류: {e}")
             return None
     
-    def get_reviews(self, company_id: Optional[int] = None, 
+    def bulk_create_reviews(self, reviews_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """리뷰 일괄 생성
+
+        건당 트랜잭션+커밋+인덱싱+캐시 무효화를 반복하는 대신, 전체를
+        단일 트랜잭션으로 INSERT하고 감정 분석은 일괄 LLM 호출로, 부서
+        배정은 스레드 풀로 겹쳐 수행한 뒤 캐시 무효화는 마지막에 1회만
+        수행한다. OpenSearch 인덱싱은 기존 배치 워커 대기열을 거친다.
+        """
+        if not reviews_data:
+            return {"created": 0, "skipped": 0, "ids": []}
+
+        try:
+            with db_manager.get_session() as session:
+                # 회사 존재 확인은 IN 쿼리 1회로 일괄 수행
+                requested_ids = {data['company_id'] for data in reviews_data}
+                valid_ids = {
+                    row[0]
+                    for row in session.query(FinancialCompany.id)
+                    .filter(FinancialCompany.id.in_(requested_ids))
+                    .all()
+                }
+
+                reviews = []
+                skipped = 0
+                for data in reviews_data:
+                    if data['company_id'] not in valid_ids:
+                        skipped += 1
+                        continue
+                    reviews.append(Review(
+                        company_id=data['company_id'],
+                        content=data['content'],
+                        rating=data.get('rating'),
+                        review_date=data.get('review_date'),
+                        platform=_PLATFORM_MAP[data['platform']].value
+                    ))
+
+                if not reviews:
+                    return {"created": 0, "skipped": skipped, "ids": []}
+
+                llm = get_llm_service()
+                if llm.is_available():
+                    dept_dicts = self._get_department_dicts(session)
+
+                    # 부서 배정을 스레드 풀에 먼저 던져두고 그 사이
+                    # 감정 분석을 일괄 호출로 수행 (두 작업이 겹침)
+                    dept_futures = None
+                    if dept_dicts:
+                        dept_futures = [
+                            self._llm_executor.submit(
+                                llm.assign_department, review.content, dept_dicts
+                            )
+                            for review in reviews
+                        ]
+
+                    sentiments = llm.analyze_sentiments_bulk(
+                        [review.content for review in reviews]
+                    )
+                    for review, sentiment_result in zip(reviews, sentiments):
+                        review.sentiment = _SENTIMENT_MAP[sentiment_result['sentiment']].value
+                        review.sentiment_score = sentiment_result['score']
+
+                    if dept_futures:
+                        for review, future in zip(reviews, dept_futures):
+                            assigned_dept = future.result()
+                            if assigned_dept:
+                                review.department_assigned = assigned_dept
+
+                for review in reviews:
+                    review.processed = True
+
+                session.add_all(reviews)
+                session.commit()
+
+                # 인덱싱 대기열에 등록 - 배치 워커가 bulk로 전송
+                for review in reviews:
+                    self._index_review_to_opensearch(review)
+
+                # 캐시 무효화는 건당이 아니라 배치당 1회, 백그라운드로 수행
+                self._bg_executor.submit(self._invalidate_cache)
+
+                logger.info("리뷰 일괄 생성 완료: %d건 (제외 %d건)", len(reviews), skipped)
+                return {
+                    "created": len(reviews),
+                    "skipped": skipped,
+                    "ids": [review.id for review in reviews]
+                }
+
+        except Exception as e:
+            logger.error(f"리뷰 일괄 생성 오류: {e}")
+            return {"created": 0, "skipped": len(reviews_data), "ids": []}
+
+    def get_reviews(self, company_id: Optional[int] = None,
                    sentiment: Optional[str] = None,
                    department: Optional[str] = None,
                    limit: int = 50) -> List[Review]:
         """리뷰 목록 조회"""
-        cache_key = f"{self.cache_prefix}:reviews:{company_id}:{sentiment}:{department}:{limit}"
+        cache_key = f"{self.cache_prefix}:v{self._current_rev()}:reviews:{company_id}:{sentiment}:{department}:{limit}"
         
         # 캐시 확인
         cached_result = redis_manager.get(cache_key)
         if cached_result:
-            logger.debug("캐시에서 리뷰 목록 반환")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("캐시에서 리뷰 목록 반환")
             return cached_result
         
         try:
             with db_manager.get_session() as session:
-                query = session.query(Review)
-                
+                # 읽기 전용 경로는 ORM 객체를 만들지 않고 Core select로
+                # 행을 바로 dict로 변환 (identity map/속성 계측 비용 제거)
+                stmt = select(
+                    Review.id,
+                    Review.company_id,
+                    Review.content,
+                    Review.rating,
+                    Review.review_date,
+                    Review.platform,
+                    Review.sentiment,
+                    Review.sentiment_score,
+                    Review.department_assigned,
+                    Review.processed,
+                    Review.created_at
+                )
+
                 if company_id:
-                    query = query.filter(Review.company_id == company_id)
-                
+                    stmt = stmt.where(Review.company_id == company_id)
+
                 if sentiment:
-                    query = query.filter(Review.sentiment == SentimentEnum(sentiment))
-                
+                    stmt = stmt.where(Review.sentiment == _SENTIMENT_MAP[sentiment].value)
+
                 if department:
-                    query = query.filter(Review.department_assigned == department)
-                
-                reviews = query.order_by(Review.created_at.desc()).limit(limit).all()
-                
-                # 결과를 딕셔너리로 변환
-                result = [review.to_dict() for review in reviews]
-                
+                    stmt = stmt.where(Review.department_assigned == department)
+
+                # 서버 사이드 커서로 행을 200건씩 받아 증분 변환 - limit이
+                # 커져도 드라이버가 전체 결과를 한 번에 버퍼링하지 않음
+                stmt = (
+                    stmt.order_by(Review.created_at.desc())
+                    .limit(limit)
+                    .execution_options(stream_results=True, yield_per=200)
+                )
+
+                result = [dict(row) for row in session.execute(stmt).mappings()]
+
                 # 캐시 저장
                 redis_manager.set(cache_key, result)
-                
+
                 return result
                 
         except Exception as e:
             logger.error(f"리뷰 목록 조회 오류: {e}")
             return []
     
+    def stream_reviews(self, company_id: Optional[int] = None,
+                       sentiment: Optional[str] = None,
+                       department: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """리뷰 목록 스트리밍 (서버 사이드 커서로 행 단위 yield, O(1) 메모리)"""
+        session = db_manager.get_session_direct()
+        try:
+            stmt = select(
+                Review.id,
+                Review.company_id,
+                Review.content,
+                Review.rating,
+                Review.review_date,
+                Review.platform,
+                Review.sentiment,
+                Review.sentiment_score,
+                Review.department_assigned,
+                Review.processed,
+                Review.created_at
+            )
+
+            if company_id:
+                stmt = stmt.where(Review.company_id == company_id)
+
+            if sentiment:
+                stmt = stmt.where(Review.sentiment == _SENTIMENT_MAP[sentiment].value)
+
+            if department:
+                stmt = stmt.where(Review.department_assigned == department)
+
+            stmt = stmt.order_by(Review.created_at.desc()).execution_options(yield_per=500)
+
+            for row in session.execute(stmt).mappings():
+                yield dict(row)
+
+        except Exception as e:
+            logger.error(f"리뷰 스트리밍 오류: {e}")
+        finally:
+            session.close()
+
     def search_reviews(self, query: str, size: int = 10) -> List[Dict[str, Any]]:
         """리뷰 검색"""
-        try:
+        cache_key = f"{self.cache_prefix}:search:{query}:{size}"
+
+        def build() -> List[Dict[str, Any]]:
             # OpenSearch에서 검색
             results = opensearch_manager.search_reviews_by_content(query, size)
-            
-            if not results:
-                logger.info(f"검색 결과 없음: {query}")
-                return []
-            
-            logger.info(f"검색 완료: {len(results)}개 결과")
+            logger.info("검색 완료: %d개 결과", len(results))
             return results
-            
+
+        try:
+            # 짧은 TTL 캐시 + 단일 빌드 락으로 동일 검색어의 중복 질의 방지
+            return redis_manager.get_or_build(
+                cache_key, build, settings.SEARCH_CACHE_TTL_SECONDS
+            )
+
         except Exception as e:
             logger.error(f"리뷰 검색 오류: {e}")
             return []
     
+    def search_reviews_multi(self, queries: List[str], size: int = 10) -> Dict[str, List[Dict[str, Any]]]:
+        """여러 검색어를 한 번의 msearch 왕복으로 검색"""
+        try:
+            bodies = [
+                {
+                    "query": {
+                        "match": {
+                            "content": query
+                        }
+                    }
+                }
+                for query in queries
+            ]
+
+            results = opensearch_manager.msearch(bodies, size)
+
+            logger.info("일괄 검색 완료: %d개 검색어", len(queries))
+            return dict(zip(queries, results))
+
+        except Exception as e:
+            logger.error(f"일괄 리뷰 검색 오류: {e}")
+            return {query: [] for query in queries}
+
     def get_sentiment_statistics(self, company_id: Optional[int] = None) -> Dict[str, Any]:
         """감정 통계 조회"""
-        cache_key = f"{self.cache_prefix}:sentiment_stats:{company_id}"
-        
-        # 캐시 확인
-        cached_result = redis_manager.get(cache_key)
-        if cached_result:
-            return cached_result
-        
-        try:
+        cache_key = f"{self.cache_prefix}:v{self._current_rev()}:sentiment_stats:{company_id}"
+
+        def build() -> Dict[str, Any]:
             with db_manager.get_session() as session:
-                query = session.query(Review)
-                
+                # GROUP BY 1회로 전체/감정별 카운트를 모두 계산 (4회 왕복 → 1회)
+                query = session.query(Review.sentiment, func.count(Review.id))
+
                 if company_id:
                     query = query.filter(Review.company_id == company_id)
-                
-                total_count = query.count()
-                
-                if total_count == 0:
-                    return {"total": 0, "positive": 0, "negative": 0, "neutral": 0}
-                
-                # 감정별 카운트
-                positive_count = query.filter(Review.sentiment == SentimentEnum.POSITIVE).count()
-                negative_count = query.filter(Review.sentiment == SentimentEnum.NEGATIVE).count()
-                neutral_count = query.filter(Review.sentiment == SentimentEnum.NEUTRAL).count()
-                
-                result = {
-                    "total": total_count,
-                    "positive": positive_count,
-                    "negative": negative_count,
-                    "neutral": neutral_count,
-                    "positive_ratio": positive_count / total_count,
-                    "negative_ratio": negative_count / total_count,
-                    "neutral_ratio": neutral_count / total_count
-                }
-                
-                # 캐시 저장
-                redis_manager.set(cache_key, result)
-                
-                return result
-                
+
+                return self._build_stats(dict(query.group_by(Review.sentiment).all()))
+
+        try:
+            # 캐시 미스 시 단일 요청만 통계 질의 수행
+            return redis_manager.get_or_build(cache_key, build)
+
         except Exception as e:
             logger.error(f"감정 통계 조회 오류: {e}")
             return {"total": 0, "positive": 0, "negative": 0, "neutral": 0}
     
+    @staticmethod
+    def _build_stats(counts: Dict[Optional[str], int]) -> Dict[str, Any]:
+        """감정별 카운트 딕셔너리로 통계 페이로드 조립"""
+        total_count = sum(counts.values())
+
+        if total_count == 0:
+            return {"total": 0, "positive": 0, "negative": 0, "neutral": 0}
+
+        positive_count = counts.get(SentimentEnum.POSITIVE.value, 0)
+        negative_count = counts.get(SentimentEnum.NEGATIVE.value, 0)
+        neutral_count = counts.get(SentimentEnum.NEUTRAL.value, 0)
+
+        return {
+            "total": total_count,
+            "positive": positive_count,
+            "negative": negative_count,
+            "neutral": neutral_count,
+            "positive_ratio": positive_count / total_count,
+            "negative_ratio": negative_count / total_count,
+            "neutral_ratio": neutral_count / total_count
+        }
+
+    def get_sentiment_statistics_multi(self, company_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """여러 회사의 감정 통계를 일괄 조회
+
+        회사당 GET+쿼리+SET을 반복하는 대신 MGET 1회로 캐시를 확인하고,
+        미스분은 GROUP BY 1회로 계산한 뒤 파이프라인 MSET 1회로 채운다.
+        """
+        if not company_ids:
+            return {}
+
+        unique_ids = list(dict.fromkeys(company_ids))
+        rev = self._current_rev()
+        keys = {
+            cid: f"{self.cache_prefix}:v{rev}:sentiment_stats:{cid}"
+            for cid in unique_ids
+        }
+
+        results: Dict[int, Dict[str, Any]] = {}
+        missing: List[int] = []
+
+        try:
+            for cid, cached in zip(unique_ids, redis_manager.mget(list(keys.values()))):
+                if isinstance(cached, dict):
+                    results[cid] = cached
+                else:
+                    missing.append(cid)
+
+            if missing:
+                with db_manager.get_session() as session:
+                    rows = (
+                        session.query(
+                            Review.company_id, Review.sentiment, func.count(Review.id)
+                        )
+                        .filter(Review.company_id.in_(missing))
+                        .group_by(Review.company_id, Review.sentiment)
+                        .all()
+                    )
+
+                counts_by_company: Dict[int, Dict[Optional[str], int]] = {
+                    cid: {} for cid in missing
+                }
+                for cid, sentiment_value, count in rows:
+                    counts_by_company[cid][sentiment_value] = count
+
+                built = {
+                    cid: self._build_stats(counts)
+                    for cid, counts in counts_by_company.items()
+                }
+                results.update(built)
+
+                redis_manager.mset({keys[cid]: stats for cid, stats in built.items()})
+
+            return {cid: results[cid] for cid in unique_ids}
+
+        except Exception as e:
+            logger.error(f"감정 통계 일괄 조회 오류: {e}")
+            empty = {"total": 0, "positive": 0, "negative": 0, "neutral": 0}
+            return {cid: results.get(cid, dict(empty)) for cid in unique_ids}
+
     def get_departments(self, session: Session) -> List[Department]:
         """부서 목록 조회"""
         try:
@@ -186,6 +501,27 @@ class ReviewService:
         except Exception as e:
             logger.error(f"부서 목록 조회 오류: {e}")
             return []
+
+    def _get_department_dicts(self, session: Session) -> List[Dict[str, Any]]:
+        """부서 목록을 직렬화된 dict로 조회 (TTL 캐시)
+
+        to_dict 변환 결과까지 캐시에 담아 리뷰 생성마다의 DB 왕복과
+        dict 변환을 모두 생략한다. 부서 생성 시 캐시가 비워진다.
+        """
+        now = time.monotonic()
+
+        with self._dept_cache_lock:
+            if self._dept_cache is not None and self._dept_cache[0] > now:
+                return self._dept_cache[1]
+
+        dept_dicts = [dept.to_dict() for dept in self.get_departments(session)]
+
+        with self._dept_cache_lock:
+            self._dept_cache = (
+                now + settings.DEPARTMENT_CACHE_TTL_SECONDS, dept_dicts
+            )
+
+        return dept_dicts
     
     def create_department(self, dept_data: Dict[str, Any]) -> Optional[Department]:
         """부서 생성"""
@@ -199,11 +535,13 @@ class ReviewService:
                 
                 session.add(department)
                 session.commit()
-                
-                # 캐시 무효화
+
+                # 캐시 무효화 (부서 목록 TTL 캐시 포함)
+                with self._dept_cache_lock:
+                    self._dept_cache = None
                 self._invalidate_cache()
                 
-                logger.info(f"부서 생성 완료: {department.name}")
+                logger.info("부서 생성 완료: %s", department.name)
                 return department
                 
         except Exception as e:
@@ -211,33 +549,75 @@ class ReviewService:
             return None
     
     def _index_review_to_opensearch(self, review: Review):
-        """리뷰를 OpenSearch에 인덱싱"""
+        """리뷰를 인덱싱 대기열에 등록 (실제 전송은 백그라운드 배치 워커)"""
         try:
             document = {
+                "id": str(review.id),
                 "company_id": review.company_id,
                 "content": review.content,
                 "rating": review.rating,
                 "review_date": review.review_date.isoformat() if review.review_date else None,
-                "platform": review.platform.value if review.platform else None,
-                "sentiment": review.sentiment.value if review.sentiment else None,
+                "platform": review.platform,
+                "sentiment": review.sentiment,
                 "sentiment_score": review.sentiment_score,
                 "department_assigned": review.department_assigned,
                 "created_at": review.created_at.isoformat() if review.created_at else None
             }
-            
-            opensearch_manager.index_document(str(review.id), document)
-            
+
+            try:
+                self._index_queue.put_nowait(document)
+            except queue.Full:
+                # 대기열 포화 시 문서 유실 대신 동기 인덱싱으로 폴백
+                logger.warning(f"인덱싱 대기열 포화, 동기 인덱싱 폴백 [{review.id}]")
+                doc_id = document.pop("id")
+                opensearch_manager.index_document(doc_id, document)
+
         except Exception as e:
             logger.error(f"OpenSearch 인덱싱 오류: {e}")
+
+    def _drain_index_queue(self):
+        """대기열의 문서를 배치 크기/플러시 간격 기준으로 bulk 인덱싱하는 워커"""
+        batch_size = settings.OPENSEARCH_INDEX_BATCH_SIZE
+        flush_interval = settings.OPENSEARCH_INDEX_FLUSH_INTERVAL
+
+        while True:
+            batch = [self._index_queue.get()]
+            deadline = time.monotonic() + flush_interval
+
+            while len(batch) < batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._index_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                opensearch_manager.bulk_index_documents(batch, chunk_size=batch_size)
+            except Exception as e:
+                logger.error(f"일괄 인덱싱 플러시 오류 ({len(batch)}건): {e}")
+            finally:
+                for _ in batch:
+                    self._index_queue.task_done()
     
     def _invalidate_cache(self):
-        """캐시 무효화"""
+        """캐시 무효화 (세대 번호만 올리면 이전 세대 키는 TTL로 소멸)"""
         try:
-            pattern = f"{self.cache_prefix}:*"
-            keys = redis_manager.keys(pattern)
-            for key in keys:
-                redis_manager.delete(key)
-            logger.debug("리뷰 서비스 캐시 무효화 완료")
+            new_rev = redis_manager.incr(f"{self.cache_prefix}:rev")
+
+            # INCR가 돌려준 새 세대를 메모에 반영해 이 프로세스의 다음
+            # 읽기가 즉시 새 세대를 보게 한다 (실패 시에는 메모 폐기)
+            with self._rev_memo_lock:
+                if new_rev is not None:
+                    self._rev_memo = (
+                        time.monotonic() + self.REV_MEMO_TTL_SECONDS, new_rev
+                    )
+                else:
+                    self._rev_memo = None
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("리뷰 서비스 캐시 세대 증가 완료")
         except Exception as e:
             logger.error(f"캐시 무효화 오류: {e}")
 
@@ -0,0 +1,96 @@
+"""
+LLM 의미 기반 응답 캐시
+"""
+import logging
+import threading
+from collections import deque
+from typing import Any, Optional, Tuple
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticCache:
+    """최근 질의의 임베딩으로 의미상 동일한 LLM 호출을 생략하는 캐시
+
+    리뷰 텍스트는 표현만 다른 중복이 많으므로 ("앱이 너무 느려요" /
+    "앱이 너무 느립니다") 정확히 일치하지 않아도 임베딩 코사인 유사도가
+    임계값 이상이면 캐시된 결과를 재사용한다. 임베딩 모델 로드에 실패하면
+    (의존성 미설치, 오프라인 등) 캐시는 조용히 비활성화되고 lookup은
+    항상 미스를 반환한다.
+    """
+
+    def __init__(self, namespace: str):
+        self.namespace = namespace
+        self.threshold = settings.SEMANTIC_CACHE_THRESHOLD
+        # (임베딩 벡터, 태그, 결과) 튜플의 고정 크기 링버퍼
+        self._entries = deque(maxlen=settings.SEMANTIC_CACHE_MAXSIZE)
+        self._lock = threading.Lock()
+        self._model = None
+        self._model_failed = False
+        self.stats = {"hits": 0, "misses": 0}
+
+    def _embed(self, text: str):
+        """텍스트를 정규화된 임베딩 벡터로 변환 (실패 시 None + 캐시 비활성화)"""
+        if self._model_failed:
+            return None
+
+        if self._model is None:
+            try:
+                # 무거운 의존성이라 첫 사용 시점에 지연 로드
+                from sentence_transformers import SentenceTransformer
+                self._model = SentenceTransformer(settings.SEMANTIC_CACHE_MODEL)
+                logger.info(f"의미 캐시 임베딩 모델 로드 완료 [{self.namespace}]")
+            except Exception as e:
+                logger.warning(f"임베딩 모델 로드 실패, 의미 캐시 비활성화 [{self.namespace}]: {e}")
+                self._model_failed = True
+                return None
+
+        try:
+            import numpy as np
+            vector = self._model.encode(text, normalize_embeddings=True)
+            return np.asarray(vector, dtype=np.float32)
+        except Exception as e:
+            logger.error(f"임베딩 계산 오류 [{self.namespace}]: {e}")
+            return None
+
+    def lookup(self, text: str, tag: str = "") -> Tuple[Optional[Any], Optional[Any]]:
+        """유사 질의의 캐시 결과 조회
+
+        (결과, 임베딩 벡터)를 반환한다. 미스 시 결과는 None이고, 벡터는
+        호출자가 LLM 응답을 받은 뒤 store()에 재사용해 임베딩을 두 번
+        계산하지 않도록 함께 돌려준다. tag가 다른 항목은 매칭하지 않는다
+        (부서 구성 등 결과의 전제가 달라지는 경우 구분용).
+        """
+        vector = self._embed(text)
+        if vector is None:
+            return None, None
+
+        with self._lock:
+            best_score = 0.0
+            best_result = None
+            for entry_vector, entry_tag, entry_result in self._entries:
+                if entry_tag != tag:
+                    continue
+                # 정규화된 벡터이므로 내적이 곧 코사인 유사도
+                score = float(entry_vector @ vector)
+                if score > best_score:
+                    best_score = score
+                    best_result = entry_result
+
+            if best_result is not None and best_score >= self.threshold:
+                self.stats["hits"] += 1
+                logger.debug(f"의미 캐시 적중 [{self.namespace}] (유사도 {best_score:.3f})")
+                return best_result, vector
+
+            self.stats["misses"] += 1
+            return None, vector
+
+    def store(self, vector, result: Any, tag: str = ""):
+        """결과를 캐시에 저장 (vector는 lookup이 돌려준 임베딩)"""
+        if vector is None or result is None:
+            return
+
+        with self._lock:
+            self._entries.append((vector, tag, result))
@@ -45,6 +45,7 @@ setup(
         "console_scripts": [
             "reai-server=app:main",
             "reai-init-data=scripts.init_data:main",
+            "reai-migrate-enums=scripts.migrate_enum_columns:main",
             "reai-test-api=scripts.test_api:main",
         ],
     },
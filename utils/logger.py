@@ -1,36 +1,68 @@
 """
 로깅 설정 유틸리티
 """
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from config.settings import settings
 
+# 로그 레코드를 실제로 기록하는 리스너 (테스트에서 stop()으로 플러시 가능)
+_queue_listener = None
+
+
+def _stop_listener():
+    """리스너 중지 (이미 중지된 경우 무시 - atexit와 수동 중지 중복 대비)"""
+    if _queue_listener is not None and _queue_listener._thread is not None:
+        _queue_listener.stop()
+
 
 def setup_logging():
     """로깅 설정"""
+    global _queue_listener
+
     # 로그 레벨 설정
     log_level = getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO)
-    
-    # 로그 포맷 설정
+
+    # 레코드 생성 시 스레드/프로세스 정보 조회 생략 (포맷에 쓰지 않음)
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging.raiseExceptions = False
+
+    # 로그 포맷 설정 (포맷 문자열은 기동 시 1회만 검증하면 충분)
     formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
+        datefmt='%Y-%m-%d %H:%M:%S',
+        style='%',
+        validate=False
     )
-    
+
     # 콘솔 핸들러
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
     console_handler.setLevel(log_level)
-    
+
+    # 요청 스레드는 큐에 넣고 바로 반환하고, 포맷팅과 stdout 쓰기는
+    # 리스너 스레드가 수행 (핫 패스에서 I/O 대기 제거)
+    log_queue = queue.Queue(-1)
+    queue_handler = QueueHandler(log_queue)
+    _queue_listener = QueueListener(
+        log_queue, console_handler, respect_handler_level=True
+    )
+    _queue_listener.start()
+    atexit.register(_stop_listener)
+
     # 루트 로거 설정
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
-    root_logger.addHandler(console_handler)
-    
+    root_logger.addHandler(queue_handler)
+
     # 외부 라이브러리 로그 레벨 조정
     logging.getLogger('urllib3').setLevel(logging.WARNING)
     logging.getLogger('requests').setLevel(logging.WARNING)
     logging.getLogger('sqlalchemy.engine').setLevel(logging.WARNING)
-    
+
     if not settings.DEBUG_MODE:
-        logging.getLogger('werkzeug').setLevel(logging.WARNING)
\ No newline at end of file
+        logging.getLogger('werkzeug').setLevel(logging.WARNING)